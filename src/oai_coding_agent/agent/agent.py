@@ -94,7 +94,9 @@ class AsyncAgent(AsyncAgentProtocol):
     Attributes:
         config: Runtime configuration for the agent
         max_turns: Maximum number of conversation turns allowed
-        events: Queue for agent events
+        events: Queue for agent events, bounded by max_queued_events so a
+            model streaming faster than the console renders pauses the
+            producer instead of growing memory without limit
     """
 
     config: RuntimeConfig
@@ -110,6 +112,7 @@ class AsyncAgent(AsyncAgentProtocol):
 
     _active_run_result: Optional[RunResultStreaming]
     _active_run_task: Optional[asyncio.Task[None]]
+    _is_processing: bool
 
     _openai_agent: Optional[OpenAIAgent]
     _conversation_history: list[ResponseInputItemParam]
@@ -117,10 +120,15 @@ class AsyncAgent(AsyncAgentProtocol):
     _exit_stack: Optional[AsyncExitStack]
     _shutdown_event: asyncio.Event
 
-    def __init__(self, config: RuntimeConfig, max_turns: int = 100):
+    def __init__(
+        self,
+        config: RuntimeConfig,
+        max_turns: int = 100,
+        max_queued_events: int = 1024,
+    ):
         self.config = config
         self.max_turns = max_turns
-        self.events = asyncio.Queue()
+        self.events = asyncio.Queue(maxsize=max_queued_events)
 
         self._agent_ready_event = asyncio.Event()
         self._agent_init_task = None
@@ -134,6 +142,7 @@ class AsyncAgent(AsyncAgentProtocol):
 
         self._active_run_result = None
         self._active_run_task = None
+        self._is_processing = False
 
         self._exit_stack = None
         self._shutdown_event = asyncio.Event()
@@ -251,6 +260,10 @@ class AsyncAgent(AsyncAgentProtocol):
                         await self.events.put(event)
 
             self._active_run_task = asyncio.create_task(_events_queue_producer(prompt))
+            # is_processing is polled on every UI frame; keep it a plain flag
+            # flipped when the run starts and when its task completes.
+            self._is_processing = True
+            self._active_run_task.add_done_callback(self._on_run_task_done)
             try:
                 await self._active_run_task
             except asyncio.CancelledError:
@@ -274,10 +287,13 @@ class AsyncAgent(AsyncAgentProtocol):
                 self._active_run_task = None
                 self._prompt_queue.task_done()
 
+    def _on_run_task_done(self, task: asyncio.Task[None]) -> None:
+        self._is_processing = False
+
     @property
     def is_processing(self) -> bool:
         """Check if the agent is currently processing a prompt."""
-        return self._active_run_task is not None and not self._active_run_task.done()
+        return self._is_processing
 
     async def run(
         self,
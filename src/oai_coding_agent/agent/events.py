@@ -6,7 +6,7 @@ and our internal agent event types, providing a stable interface for the UI.
 """
 
 from dataclasses import dataclass
-from typing import Optional, Union
+from typing import Any, Callable, Dict, Optional, Union
 
 from agents import RunItemStreamEvent, StreamEvent
 from agents.items import (  # type: ignore[attr-defined]
@@ -29,7 +29,7 @@ from openai.types.responses import ResponseCompletedEvent
 
 
 # Internal agent event types
-@dataclass
+@dataclass(slots=True)
 class ToolCallEvent:
     """A tool call event with well-defined types."""
 
@@ -38,14 +38,14 @@ class ToolCallEvent:
     call_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReasoningEvent:
     """A reasoning event with well-defined types."""
 
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageOutputEvent:
     """A message output event with well-defined types."""
 
@@ -53,14 +53,14 @@ class MessageOutputEvent:
 
 
 # Internal agent event types
-@dataclass
+@dataclass(slots=True)
 class ErrorEvent:
     """An error event emitted by the agent (e.g. MaxTurnsExceeded)."""
 
     message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCallOutputEvent:
     """The output side of a tool call (e.g. function call result)."""
 
@@ -68,7 +68,7 @@ class ToolCallOutputEvent:
     output: str
 
 
-@dataclass
+@dataclass(slots=True)
 class UsageEvent:
     input_tokens: int
     cached_input_tokens: int
@@ -101,45 +101,85 @@ AgentEvent = Union[
 ]
 
 
+# Builds a ToolCallEvent per raw tool call class. Only function and MCP calls
+# carry a name/arguments pair; the hosted tools are described by their payload.
+_TOOL_CALL_EXTRACTORS: Dict[type, Callable[[Any], ToolCallEvent]] = {
+    ResponseFunctionToolCall: lambda raw: ToolCallEvent(
+        name=raw.name, arguments=raw.arguments, call_id=raw.call_id
+    ),
+    McpCall: lambda raw: ToolCallEvent(
+        name=raw.name, arguments=raw.arguments, call_id=raw.id
+    ),
+    # LocalShellCall has action with command array
+    LocalShellCall: lambda raw: ToolCallEvent(
+        name="shell",
+        arguments=" ".join(raw.action.command) if raw.action.command else "",
+    ),
+    # Computer tool calls have an action instead of name/arguments
+    ResponseComputerToolCall: lambda raw: ToolCallEvent(
+        name="computer", arguments=str(raw.action)
+    ),
+    ResponseCodeInterpreterToolCall: lambda raw: ToolCallEvent(
+        name="code_interpreter", arguments=raw.code or ""
+    ),
+    ResponseFileSearchToolCall: lambda raw: ToolCallEvent(
+        name="file_search", arguments=", ".join(raw.queries)
+    ),
+    # Web search and image generation expose no query/prompt, just status
+    ResponseFunctionWebSearch: lambda raw: ToolCallEvent(
+        name="web_search", arguments=""
+    ),
+    ImageGenerationCall: lambda raw: ToolCallEvent(
+        name="image_generation", arguments=""
+    ),
+}
+
+
 def _extract_tool_call_info(raw_item: ToolCallItemTypes) -> Optional[ToolCallEvent]:
     """Extract name and arguments from a tool call item."""
-    match raw_item:
-        case ResponseFunctionToolCall(name=name, arguments=arguments, call_id=call_id):
-            return ToolCallEvent(name=name, arguments=arguments, call_id=call_id)
-
-        case McpCall(id=id, name=name, arguments=arguments):
-            return ToolCallEvent(name=name, arguments=arguments, call_id=id)
-
-        case LocalShellCall(action=action):
-            # LocalShellCall has action with command array
-            command_str = " ".join(action.command) if action.command else ""
-            return ToolCallEvent(name="shell", arguments=command_str)
-
-        case ResponseComputerToolCall(action=action):
-            # Computer tool calls have action instead of name/arguments
-            # Convert action to a string representation
-            return ToolCallEvent(name="computer", arguments=str(action))
-
-        case ResponseCodeInterpreterToolCall(code=code):
-            # Code interpreter has code instead of name/arguments
-            return ToolCallEvent(name="code_interpreter", arguments=code)
-
-        case ResponseFileSearchToolCall(queries=queries):
-            # File search has queries instead of name/arguments
-            # Join queries into a single string
-            return ToolCallEvent(name="file_search", arguments=", ".join(queries))
-
-        case ResponseFunctionWebSearch():
-            # Web search doesn't have query attribute, just status
-            return ToolCallEvent(name="web_search", arguments="")
-
-        case ImageGenerationCall():
-            # Image generation doesn't have prompt attribute, just result
-            return ToolCallEvent(name="image_generation", arguments="")
-
-        case _:
-            # Unknown tool call type
-            return None
+    extractor = _TOOL_CALL_EXTRACTORS.get(raw_item.__class__)
+    # Unknown tool call type
+    return extractor(raw_item) if extractor is not None else None
+
+
+def _map_tool_call_item(item: ToolCallItem) -> Optional[AgentEvent]:
+    return _extract_tool_call_info(item.raw_item)
+
+
+def _map_tool_call_output_item(item: ToolCallOutputItem) -> Optional[AgentEvent]:
+    raw_item = item.raw_item
+    if not isinstance(raw_item, dict) or raw_item.get("type") != "function_call_output":
+        return None
+    call_id = raw_item.get("call_id")
+    output = raw_item.get("output")
+    if isinstance(call_id, str) and isinstance(output, str):
+        return ToolCallOutputEvent(call_id=call_id, output=output)
+    return None
+
+
+def _map_reasoning_item(item: ReasoningItem) -> Optional[AgentEvent]:
+    if not item.raw_item.summary:
+        return None
+    # Concatenate all summary items
+    summary_texts = [summary.text for summary in item.raw_item.summary]
+    return ReasoningEvent(text="\n\n".join(summary_texts))
+
+
+def _map_message_output_item(item: MessageOutputItem) -> Optional[AgentEvent]:
+    if not item.raw_item.content:
+        return None
+    # Concatenate all content items
+    content_texts = [content.text for content in item.raw_item.content]  # type: ignore[union-attr]
+    return MessageOutputEvent(text="\n\n".join(content_texts))
+
+
+# Mapper per run item class; item types without an entry are not surfaced
+_ITEM_MAPPERS: Dict[type, Callable[[Any], Optional[AgentEvent]]] = {
+    ToolCallItem: _map_tool_call_item,
+    ToolCallOutputItem: _map_tool_call_output_item,
+    ReasoningItem: _map_reasoning_item,
+    MessageOutputItem: _map_message_output_item,
+}
 
 
 def map_sdk_event_to_agent_event(
@@ -157,51 +197,27 @@ def map_sdk_event_to_agent_event(
         An internal agent event (ToolCallEvent, ReasoningEvent, or MessageOutputEvent),
         or None if the SDK event cannot be mapped
     """
-    match sdk_event:
-        case RunItemStreamEvent(item=item):
-            # Process the item within RunItemStreamEvent
-            match item:
-                case ToolCallItem(raw_item=raw_item):
-                    return _extract_tool_call_info(raw_item)
-
-                case ToolCallOutputItem(
-                    raw_item={
-                        "type": "function_call_output",
-                        "call_id": call_id,
-                        "output": output,
-                    }
-                ) if isinstance(call_id, str) and isinstance(output, str):
-                    return ToolCallOutputEvent(call_id=call_id, output=output)
-
-                case ReasoningItem(raw_item=raw_item) if raw_item.summary:
-                    # Concatenate all summary items
-                    summary_texts = [item.text for item in raw_item.summary]
-                    combined_text = "\n\n".join(summary_texts)
-                    return ReasoningEvent(text=combined_text)
-
-                case MessageOutputItem(raw_item=raw_item) if raw_item.content:
-                    # Concatenate all content items
-                    content_texts = [item.text for item in raw_item.content]  # type: ignore[union-attr]
-                    combined_text = "\n\n".join(content_texts)
-                    return MessageOutputEvent(text=combined_text)
-
-                case _:
-                    # Other item types we don't handle
-                    return None
-
-        case RawResponsesStreamEvent(data=resp_ev) if isinstance(
-            resp_ev, ResponseCompletedEvent
-        ):
-            usage = resp_ev.response.usage
-            if usage is None:
-                return None
-            return UsageEvent(
-                input_tokens=usage.input_tokens,
-                cached_input_tokens=usage.input_tokens_details.cached_tokens,
-                output_tokens=usage.output_tokens,
-                reasoning_output_tokens=usage.output_tokens_details.reasoning_tokens,
-                total_tokens=usage.total_tokens,
-            )
-        case _:
-            # Other StreamEvent types we don't care about
+    # Raw response events (one per streamed token delta) make up nearly all of
+    # the stream and only the final ResponseCompletedEvent maps to anything,
+    # so reject the rest first.
+    if isinstance(sdk_event, RawResponsesStreamEvent):
+        if not isinstance(sdk_event.data, ResponseCompletedEvent):
+            return None
+        usage = sdk_event.data.response.usage
+        if usage is None:
             return None
+        return UsageEvent(
+            input_tokens=usage.input_tokens,
+            cached_input_tokens=usage.input_tokens_details.cached_tokens,
+            output_tokens=usage.output_tokens,
+            reasoning_output_tokens=usage.output_tokens_details.reasoning_tokens,
+            total_tokens=usage.total_tokens,
+        )
+
+    if isinstance(sdk_event, RunItemStreamEvent):
+        item = sdk_event.item
+        mapper = _ITEM_MAPPERS.get(item.__class__)
+        return mapper(item) if mapper is not None else None
+
+    # Other StreamEvent types we don't care about
+    return None
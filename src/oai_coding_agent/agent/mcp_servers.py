@@ -2,10 +2,13 @@
 Launch and register cleanup for filesystem, CLI & Git MCP servers via AsyncExitStack.
 """
 
+import asyncio
+import atexit
+import functools
 import logging
 import os
 from contextlib import AsyncExitStack
-from typing import Any, List
+from typing import Any, List, TextIO, Tuple
 
 from agents.mcp import MCPServer, MCPServerStdio
 from mcp.client.stdio import stdio_client
@@ -45,12 +48,69 @@ ALLOWED_CLI_COMMANDS = [
 
 ALLOWED_CLI_FLAGS = ["all"]
 
+# Comma-separated forms passed to the CLI MCP server's environment
+_ALLOWED_CLI_COMMANDS_ENV = ",".join(ALLOWED_CLI_COMMANDS)
+_ALLOWED_CLI_FLAGS_ENV = ",".join(ALLOWED_CLI_FLAGS)
+
+
+@functools.cache
+def _devnull() -> TextIO:
+    """Shared sink for MCP server stderr, opened on first use.
+
+    One handle serves every server (and every reconnect) instead of a new,
+    never-closed file per stream; it is closed at interpreter exit.
+    """
+    devnull = open(os.devnull, "w")
+    atexit.register(devnull.close)
+    return devnull
+
 
 class QuietMCPServerStdio(MCPServerStdio):
     """Variant of MCPServerStdio that silences child-process stderr."""
 
     def create_streams(self) -> Any:
-        return stdio_client(self.params, errlog=open(os.devnull, "w"))
+        return stdio_client(self.params, errlog=_devnull())
+
+
+async def _enter_in_owner_task(
+    ctx: MCPServerStdio, exit_stack: AsyncExitStack
+) -> MCPServer:
+    """Enter ``ctx`` in a dedicated task and register its shutdown on exit_stack.
+
+    MCP stdio clients hold anyio cancel scopes, which must be exited by the same
+    task that entered them. Giving each server an owner task lets the servers
+    start concurrently while the exit stack still closes each one from the task
+    that opened it.
+    """
+    started: asyncio.Future[MCPServer] = asyncio.get_running_loop().create_future()
+    stop = asyncio.Event()
+
+    async def own() -> None:
+        try:
+            async with ctx as server:
+                started.set_result(server)
+                await stop.wait()
+        except Exception as e:
+            if started.done():
+                raise
+            started.set_exception(e)
+        finally:
+            if not started.done():
+                started.cancel()
+
+    task = asyncio.create_task(own())
+    try:
+        server = await started
+    except BaseException:
+        task.cancel()
+        raise
+
+    async def close() -> None:
+        stop.set()
+        await task
+
+    exit_stack.push_async_callback(close)
+    return server
 
 
 async def start_mcp_servers(
@@ -62,28 +122,28 @@ async def start_mcp_servers(
 
     If mode is "plan" and atlassian flag is True, also starts the Atlassian MCP server.
 
-    Returns a list of connected MCPServerStdio instances.
+    The servers are launched concurrently, so startup takes about as long as the
+    slowest server rather than the sum of all of them. Optional servers that fail
+    to launch with OSError are logged and skipped; the filesystem server is
+    required.
+
+    Returns a list of connected MCPServerStdio instances, in a stable order.
     """
-    servers: List[MCPServer] = []
+    # (label, server context, required)
+    entries: List[Tuple[str, MCPServerStdio, bool]] = []
 
     # Atlassian Official MCP server (only in plan mode and when atlassian flag is set)
     if config.mode.value == "plan" and config.atlassian:
-        try:
-            atlassian_ctx = QuietMCPServerStdio(
-                name="atlassian-mcp",
-                params={
-                    "command": "npx",
-                    "args": ["-y", "mcp-remote", "https://mcp.atlassian.com/v1/sse"],
-                },
-                client_session_timeout_seconds=120,
-                cache_tools_list=True,
-            )
-            atlassian = await exit_stack.enter_async_context(atlassian_ctx)
-
-            servers.append(atlassian)
-            logger.info("Atlassian MCP server started successfully")
-        except OSError:
-            logger.exception("Failed to start Atlassian MCP server")
+        atlassian_ctx = QuietMCPServerStdio(
+            name="atlassian-mcp",
+            params={
+                "command": "npx",
+                "args": ["-y", "mcp-remote", "https://mcp.atlassian.com/v1/sse"],
+            },
+            client_session_timeout_seconds=120,
+            cache_tools_list=True,
+        )
+        entries.append(("Atlassian", atlassian_ctx, False))
 
     # Filesystem MCP server
     fs_ctx = QuietMCPServerStdio(
@@ -99,86 +159,80 @@ async def start_mcp_servers(
         client_session_timeout_seconds=30,
         cache_tools_list=True,
     )
-    fs = await exit_stack.enter_async_context(fs_ctx)
-
-    servers.append(fs)
-    logger.info("Filesystem MCP server started successfully")
+    entries.append(("Filesystem", fs_ctx, True))
 
     # CLI MCP server
-    try:
-        cli_ctx = QuietMCPServerStdio(
-            name="cli-mcp-server",
-            params={
-                "command": "uvx",
-                "args": ["cli-mcp-server"],
-                "env": {
-                    "ALLOWED_DIR": str(config.repo_path),
-                    "ALLOWED_COMMANDS": ",".join(ALLOWED_CLI_COMMANDS),
-                    "ALLOWED_FLAGS": ",".join(ALLOWED_CLI_FLAGS),
-                    "ALLOW_SHELL_OPERATORS": "true",
-                    "COMMAND_TIMEOUT": "120",
-                    # set OAI_AGENT so commit-msg hook sees it
-                    "OAI_AGENT": "true",
-                },
+    cli_ctx = QuietMCPServerStdio(
+        name="cli-mcp-server",
+        params={
+            "command": "uvx",
+            "args": ["cli-mcp-server"],
+            "env": {
+                "ALLOWED_DIR": str(config.repo_path),
+                "ALLOWED_COMMANDS": _ALLOWED_CLI_COMMANDS_ENV,
+                "ALLOWED_FLAGS": _ALLOWED_CLI_FLAGS_ENV,
+                "ALLOW_SHELL_OPERATORS": "true",
+                "COMMAND_TIMEOUT": "120",
+                # set OAI_AGENT so commit-msg hook sees it
+                "OAI_AGENT": "true",
             },
-            client_session_timeout_seconds=120,
-            cache_tools_list=True,
-        )
-        cli = await exit_stack.enter_async_context(cli_ctx)
-
-        servers.append(cli)
-        logger.info("CLI MCP server started successfully")
-    except OSError:
-        logger.exception("Failed to start CLI MCP server")
+        },
+        client_session_timeout_seconds=120,
+        cache_tools_list=True,
+    )
+    entries.append(("CLI", cli_ctx, False))
 
     # Git MCP server
-    try:
-        git_ctx = QuietMCPServerStdio(
-            name="mcp-server-git",
+    git_ctx = QuietMCPServerStdio(
+        name="mcp-server-git",
+        params={
+            "command": "uvx",
+            "args": ["mcp-server-git"],
+            # set OAI_AGENT so commit-msg hook sees it
+            "env": {"OAI_AGENT": "true"},
+        },
+        client_session_timeout_seconds=120,
+        cache_tools_list=True,
+    )
+    entries.append(("Git", git_ctx, False))
+
+    # GitHub MCP server (only if token is available)
+    if config.github_token:
+        gh_ctx = QuietMCPServerStdio(
+            # TODO: Change to use remote MCP instead
+            name="github-mcp-server",
             params={
-                "command": "uvx",
-                "args": ["mcp-server-git"],
-                # set OAI_AGENT so commit-msg hook sees it
-                "env": {"OAI_AGENT": "true"},
+                "command": "docker",
+                "args": [
+                    "run",
+                    "-i",
+                    "--rm",
+                    "-e",
+                    "GITHUB_PERSONAL_ACCESS_TOKEN",
+                    "ghcr.io/github/github-mcp-server:v0.5.0",
+                ],
+                "env": {"GITHUB_PERSONAL_ACCESS_TOKEN": config.github_token},
             },
             client_session_timeout_seconds=120,
             cache_tools_list=True,
         )
-        git = await exit_stack.enter_async_context(git_ctx)
-
-        servers.append(git)
-        logger.info("Git MCP server started successfully")
-    except OSError:
-        logger.exception("Failed to start Git MCP server")
-
-    # GitHub MCP server (only if token is available)
-    if config.github_token:
-        try:
-            gh_ctx = QuietMCPServerStdio(
-                # TODO: Change to use remote MCP instead
-                name="github-mcp-server",
-                params={
-                    "command": "docker",
-                    "args": [
-                        "run",
-                        "-i",
-                        "--rm",
-                        "-e",
-                        "GITHUB_PERSONAL_ACCESS_TOKEN",
-                        "ghcr.io/github/github-mcp-server:v0.5.0",
-                    ],
-                    "env": {"GITHUB_PERSONAL_ACCESS_TOKEN": config.github_token},
-                },
-                client_session_timeout_seconds=120,
-                cache_tools_list=True,
-            )
-            gh = await exit_stack.enter_async_context(gh_ctx)
-
-            servers.append(gh)
-            logger.info("GitHub MCP server started successfully")
-        except OSError:
-            logger.exception("Failed to start GitHub MCP server")
+        entries.append(("GitHub", gh_ctx, False))
     else:
         logger.info("No GitHub token available, skipping GitHub MCP server")
 
+    results = await asyncio.gather(
+        *(_enter_in_owner_task(ctx, exit_stack) for _, ctx, _ in entries),
+        return_exceptions=True,
+    )
+
+    servers: List[MCPServer] = []
+    for (label, _, required), result in zip(entries, results):
+        if isinstance(result, BaseException):
+            if required or not isinstance(result, OSError):
+                raise result
+            logger.error("Failed to start %s MCP server", label, exc_info=result)
+            continue
+        servers.append(result)
+        logger.info("%s MCP server started successfully", label)
+
     return servers
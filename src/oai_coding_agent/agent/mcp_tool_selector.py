@@ -2,6 +2,7 @@
 Mode-based selection and filtering of MCP function-tools per server.
 """
 
+import asyncio
 from typing import List
 
 from agents.mcp import MCPServer
@@ -10,6 +11,49 @@ from agents.tool import Tool
 
 from oai_coding_agent.runtime_config import RuntimeConfig
 
+# Git MCP server: tools allowed in plan mode
+_GIT_PLAN_TOOLS = frozenset({"clone_repo", "list_branches"})
+
+# GitHub MCP server: read-only tools allowed in plan mode
+_GITHUB_READONLY_TOOLS = frozenset(
+    {
+        "get_issue",
+        "get_issue_comments",
+        "create_issue",
+        "list_issues",
+        "search_issues",
+        "get_pull_request",
+        "list_pull_requests",
+        "get_pull_request_files",
+        "get_pull_request_status",
+        "get_pull_request_comments",
+        "get_pull_request_reviews",
+    }
+)
+
+# GitHub MCP server: full whitelist including create/update in non-plan modes
+_GITHUB_TOOLS = frozenset(
+    {
+        "get_issue",
+        "get_issue_comments",
+        "create_issue",
+        "add_issue_comment",
+        "list_issues",
+        "update_issue",
+        "search_issues",
+        "get_pull_request",
+        "list_pull_requests",
+        "get_pull_request_files",
+        "get_pull_request_status",
+        "update_pull_request_branch",
+        "get_pull_request_comments",
+        "get_pull_request_reviews",
+        "create_pull_request",
+        "add_pull_request_review_comment",
+        "update_pull_request",
+    }
+)
+
 
 def _filter_tools_for_mode(
     server_name: str, tools: List[Tool], config: RuntimeConfig
@@ -28,8 +72,7 @@ def _filter_tools_for_mode(
     # Git MCP server: restrict to a whitelist in plan mode (adjust as needed)
     if server_name == "mcp-server-git":
         if mode == "plan":
-            allowed = {"clone_repo", "list_branches"}
-            return [t for t in tools if t.name in allowed]
+            return [t for t in tools if t.name in _GIT_PLAN_TOOLS]
 
     # Atlassian MCP server: only allow when in plan mode and atlassian flag is set
     if server_name == "atlassian-mcp":
@@ -43,41 +86,9 @@ def _filter_tools_for_mode(
     if server_name == "github-mcp-server":
         # Read-only commands only in plan mode
         if mode == "plan":
-            readonly_allowed = {
-                "get_issue",
-                "get_issue_comments",
-                "create_issue",
-                "list_issues",
-                "search_issues",
-                "get_pull_request",
-                "list_pull_requests",
-                "get_pull_request_files",
-                "get_pull_request_status",
-                "get_pull_request_comments",
-                "get_pull_request_reviews",
-            }
-            return [t for t in tools if t.name in readonly_allowed]
+            return [t for t in tools if t.name in _GITHUB_READONLY_TOOLS]
         # Full whitelist including create/update in non-plan modes
-        allowed = {
-            "get_issue",
-            "get_issue_comments",
-            "create_issue",
-            "add_issue_comment",
-            "list_issues",
-            "update_issue",
-            "search_issues",
-            "get_pull_request",
-            "list_pull_requests",
-            "get_pull_request_files",
-            "get_pull_request_status",
-            "update_pull_request_branch",
-            "get_pull_request_comments",
-            "get_pull_request_reviews",
-            "create_pull_request",
-            "add_pull_request_review_comment",
-            "update_pull_request",
-        }
-        return [t for t in tools if t.name in allowed]
+        return [t for t in tools if t.name in _GITHUB_TOOLS]
 
     # No filtering by default
     return tools
@@ -98,11 +109,14 @@ async def get_filtered_function_tools(
     Returns:
         A flattened list of filtered FunctionTool objects ready to attach to an Agent.
     """
-    filtered_tools: List[Tool] = []
-    for server in servers:
-        server_tools = await MCPUtil.get_function_tools(
-            server, convert_schemas_to_strict
+    # Each server answers over its own session, so query them all at once
+    server_tool_lists = await asyncio.gather(
+        *(
+            MCPUtil.get_function_tools(server, convert_schemas_to_strict)
+            for server in servers
         )
-        server_tools = _filter_tools_for_mode(server.name, server_tools, config)
-        filtered_tools.extend(server_tools)
+    )
+    filtered_tools: List[Tool] = []
+    for server, server_tools in zip(servers, server_tool_lists):
+        filtered_tools.extend(_filter_tools_for_mode(server.name, server_tools, config))
     return filtered_tools
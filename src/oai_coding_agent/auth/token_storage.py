@@ -1,3 +1,4 @@
+import functools
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -11,24 +12,35 @@ def get_auth_file_path() -> Path:
     return get_config_dir() / _AUTH_FILE
 
 
+@functools.lru_cache(maxsize=1)
+def _parse_entries(auth_file: Path, mtime_ns: int, size: int) -> Dict[str, str]:
+    """Parse the auth file; cached so an unchanged file costs one stat()."""
+    entries: Dict[str, str] = {}
+    for line in auth_file.read_text().splitlines():
+        k, sep, v = line.partition("=")
+        if sep:
+            entries[k] = v
+    return entries
+
+
 def _read_entries() -> Dict[str, str]:
     """Load all KEY=VALUE lines from the auth file (silently returns {} if missing)."""
     auth_file = get_auth_file_path()
     try:
-        lines = auth_file.read_text().splitlines()
+        stat = auth_file.stat()
+        entries = _parse_entries(auth_file, stat.st_mtime_ns, stat.st_size)
     except FileNotFoundError:
         return {}
-    entries: Dict[str, str] = {}
-    for line in lines:
-        if "=" in line:
-            k, v = line.split("=", 1)
-            entries[k] = v
-    return entries
+    # Callers update the returned dict, so never hand out the cached one
+    return dict(entries)
 
 
 def _write_entries(entries: Dict[str, str]) -> bool:
     """Overwrite the auth file with the given KEY=VALUE entries (secure perms)."""
     auth_file = get_auth_file_path()
+    # A rewrite can keep the same size and, on coarse-grained filesystems, the
+    # same mtime, so drop the cached parse instead of relying on stat
+    _parse_entries.cache_clear()
     try:
         auth_file.parent.mkdir(parents=True, exist_ok=True)
         content = "\n".join(f"{k}={v}" for k, v in entries.items()) + "\n"
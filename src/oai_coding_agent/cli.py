@@ -203,10 +203,12 @@ def main(
 
         if not prompt:
             logger.info(
-                f"Starting chat with model {cfg.model.value} on repo {cfg.repo_path}"
+                "Starting chat with model %s on repo %s",
+                cfg.model.value,
+                cfg.repo_path,
             )
         else:
-            logger.info(f"Running prompt in headless (async): {cfg.prompt}")
+            logger.info("Running prompt in headless (async): %s", cfg.prompt)
 
         try:
             factory = _agent_factory or default_agent_factory
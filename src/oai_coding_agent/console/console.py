@@ -33,7 +33,10 @@ class HeadlessConsole(ConsoleInterface):
         async with self.agent:
             try:
                 async for event in self.agent.run(self.agent.config.prompt):
-                    render_event(event)
+                    # Rich buffers output inside the console context, so each
+                    # event reaches the terminal in a single write
+                    with console:
+                        render_event(event)
             except KeyboardInterrupt:
                 # Cancel agent gracefully on interrupt
                 await self.agent.cancel()
@@ -0,0 +1,72 @@
+"""
+Prompt history backed by prompt_toolkit's FileHistory format, loading only the tail.
+"""
+
+import io
+import os
+from pathlib import Path
+from typing import Iterable, List
+
+from prompt_toolkit.history import FileHistory
+
+# Every stored entry starts with a "# <timestamp>" header line; content lines
+# start with "+", so a newline followed by "#" only ever marks an entry header.
+_ENTRY_HEADER = b"\n#"
+
+
+class TailFileHistory(FileHistory):
+    """FileHistory that loads only the newest ``max_entries`` entries.
+
+    The file is read backwards in ``chunk_size`` blocks from EOF until enough
+    entry headers have been seen, so startup cost depends on ``max_entries``
+    rather than on the size of the history file. Storing is unchanged, so the
+    file stays compatible with FileHistory and keeps every entry on disk.
+    """
+
+    def __init__(
+        self, filename: Path, max_entries: int = 1000, chunk_size: int = 64 * 1024
+    ) -> None:
+        super().__init__(str(filename))
+        self.max_entries = max_entries
+        self.chunk_size = chunk_size
+
+    def _read_tail(self) -> bytes:
+        """Return the bytes holding the last max_entries complete entries."""
+        with open(self.filename, "rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            data = b""
+            # Need one header more than max_entries so the oldest kept entry is
+            # complete (its header sits after the cut point).
+            while pos > 0 and data.count(_ENTRY_HEADER) <= self.max_entries:
+                step = min(self.chunk_size, pos)
+                pos -= step
+                f.seek(pos)
+                data = f.read(step) + data
+
+        if pos > 0:
+            # Drop the partial entry in front of the first complete header
+            data = data[data.find(_ENTRY_HEADER) + 1 :]
+        return data
+
+    def load_history_strings(self) -> Iterable[str]:
+        try:
+            data = self._read_tail()
+        except FileNotFoundError:
+            return []
+
+        strings: List[str] = []
+        lines: List[str] = []
+        for line_bytes in io.BytesIO(data):
+            line = line_bytes.decode("utf-8", errors="replace")
+            if line.startswith("+"):
+                lines.append(line[1:])
+            else:
+                if lines:
+                    # Join and drop trailing newline (same as FileHistory)
+                    strings.append("".join(lines)[:-1])
+                lines = []
+        if lines:
+            strings.append("".join(lines)[:-1])
+
+        # Newest entries first, as prompt_toolkit expects
+        return reversed(strings[-self.max_entries :])
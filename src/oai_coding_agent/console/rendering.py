@@ -1,5 +1,5 @@
 import json
-from typing import Any, Dict, Protocol
+from typing import Any, Callable, Dict, Protocol
 
 from rich.console import Console, ConsoleOptions, RenderResult
 from rich.markdown import Heading, Markdown
@@ -49,15 +49,25 @@ class EventRenderer(Protocol):
 
 
 class ToolCallManager:
-    """Manages pairing of tool calls with their outputs."""
+    """Manages pairing of tool calls with their outputs.
 
-    def __init__(self) -> None:
+    Calls whose output never arrives (e.g. a cancelled run) would otherwise
+    stay pending for the rest of the session, so at most ``max_pending`` calls
+    are kept and the oldest is dropped once the limit is reached.
+    """
+
+    def __init__(self, max_pending: int = 256) -> None:
         self.pending_tool_calls: Dict[str, ToolCallEvent] = {}
+        self.max_pending = max_pending
 
     def handle_tool_call(self, tool_call: ToolCallEvent) -> None:
         """Store tool call for later pairing with output."""
         if tool_call.call_id:
-            self.pending_tool_calls[tool_call.call_id] = tool_call
+            pending = self.pending_tool_calls
+            if len(pending) >= self.max_pending and tool_call.call_id not in pending:
+                # Dicts keep insertion order, so the first key is the oldest call
+                del pending[next(iter(pending))]
+            pending[tool_call.call_id] = tool_call
         else:
             # Render immediately if no call_id (can't be paired)
             render_tool_call_standalone(tool_call)
@@ -96,15 +106,19 @@ def _parse_output_data(output: str) -> str:
 
 def _truncate_output_lines(text: str, max_lines: int = 8) -> str:
     """Truncate multi-line text to at most max_lines, appending ellipsis if needed."""
-    lines = text.split("\n")
-    if len(lines) > max_lines:
-        return "\n".join(lines[:max_lines]) + "\n..."
-    return text
+    # Tool output can be large and only the head is shown, so find the cut
+    # point instead of splitting the whole text into lines
+    end = -1
+    for _ in range(max_lines):
+        end = text.find("\n", end + 1)
+        if end == -1:
+            return text
+    return text[:end] + "\n..."
 
 
 def render_tool_call_standalone(tool_call: ToolCallEvent) -> None:
     """Render a tool call without output."""
-    title = Text(f"{tool_call.name}", style="green bold")
+    title = Text(tool_call.name, style="green bold")
     console.print(title)
 
     if tool_call.arguments:
@@ -134,33 +148,8 @@ def render_tool_call_with_output(
         args_data = {}
 
     # Dispatch to tool-specific renderers
-    if tool_call.name == "read_file":
-        render_read_file_tool(tool_call, output_text, args_data)
-    elif tool_call.name == "edit_file":
-        render_edit_file_tool(tool_call, output_text, args_data)
-    elif tool_call.name == "list_directory":
-        render_list_directory_tool(tool_call, output_text, args_data)
-    elif tool_call.name == "search_files":
-        render_search_files_tool(tool_call, output_text, args_data)
-    elif tool_call.name == "read_multiple_files":
-        render_read_multiple_files_tool(tool_call, output_text, args_data)
-    elif tool_call.name == "directory_tree":
-        render_directory_tree_tool(tool_call, output_text, args_data)
-    elif tool_call.name == "write_file":
-        render_write_file_tool(tool_call, output_text, args_data)
-    elif tool_call.name == "move_file":
-        render_move_file_tool(tool_call, output_text, args_data)
-    elif tool_call.name == "git_add":
-        render_git_add_tool(tool_call, output_text, args_data)
-    elif tool_call.name == "git_commit":
-        render_git_commit_tool(tool_call, output_text, args_data)
-    elif tool_call.name == "git_status":
-        render_git_status_tool(tool_call, output_text, args_data)
-    elif tool_call.name in ["run_command", "shell"]:
-        render_command_tool(tool_call, output_text, args_data)
-
-    else:
-        render_generic_tool(tool_call, output_text, args_data)
+    renderer = _TOOL_RENDERERS.get(tool_call.name, render_generic_tool)
+    renderer(tool_call, output_text, args_data)
 
 
 def render_read_file_tool(
@@ -394,41 +383,82 @@ def render_generic_tool(
     console.print()
 
 
+# Tool-specific renderers keyed by tool name; other tools use
+# render_generic_tool
+_TOOL_RENDERERS: Dict[str, Callable[[ToolCallEvent, str, Dict[str, Any]], None]] = {
+    "read_file": render_read_file_tool,
+    "edit_file": render_edit_file_tool,
+    "list_directory": render_list_directory_tool,
+    "search_files": render_search_files_tool,
+    "read_multiple_files": render_read_multiple_files_tool,
+    "directory_tree": render_directory_tree_tool,
+    "write_file": render_write_file_tool,
+    "move_file": render_move_file_tool,
+    "git_add": render_git_add_tool,
+    "git_commit": render_git_commit_tool,
+    "git_status": render_git_status_tool,
+    "run_command": render_command_tool,
+    "shell": render_command_tool,
+}
+
+
 # Global tool call manager
 _tool_manager = ToolCallManager()
 
 
+def _render_tool_call_event(tool_call: ToolCallEvent) -> None:
+    _tool_manager.handle_tool_call(tool_call)
+
+
+def _render_tool_output_event(tool_output: ToolCallOutputEvent) -> None:
+    # Try to pair with tool call, if not found render standalone
+    if not _tool_manager.handle_tool_output(tool_output):
+        output_text = _parse_output_data(tool_output.output)
+        if len(output_text) > 200:
+            output_text = output_text[:200] + "..."
+        console.print(
+            f"[dim]unpaired tool output:[/dim] [dim green]{output_text}[/dim green]"
+        )
+        console.print()
+
+
+def _render_reasoning_event(event: ReasoningEvent) -> None:
+    md = Markdown(
+        event.text, code_theme="ansi_dark", hyperlinks=True, style="dim italic"
+    )
+    console.print(md)
+    console.print()
+
+
+def _render_message_output_event(event: MessageOutputEvent) -> None:
+    md = Markdown(event.text, code_theme="ansi_dark", hyperlinks=True)
+    console.print(md)
+    console.print()
+
+
+# Constant header shared by every error event; printing does not modify it
+_ERROR_HEADER = Text("Error", style="bold red")
+
+
+def _render_error_event(event: ErrorEvent) -> None:
+    console.print(_ERROR_HEADER)
+    console.print(f"  {event.message}")
+    console.print()
+
+
+# Renderer per event type; events without an entry (e.g. UsageEvent) are not
+# rendered
+_EVENT_RENDERERS: Dict[type, Callable[[Any], None]] = {
+    ToolCallEvent: _render_tool_call_event,
+    ToolCallOutputEvent: _render_tool_output_event,
+    ReasoningEvent: _render_reasoning_event,
+    MessageOutputEvent: _render_message_output_event,
+    ErrorEvent: _render_error_event,
+}
+
+
 def render_event(event: AgentEvent) -> None:
     """Render an agent event with rich formatting."""
-    match event:
-        case ToolCallEvent() as tool_call:
-            _tool_manager.handle_tool_call(tool_call)
-
-        case ToolCallOutputEvent() as tool_output:
-            # Try to pair with tool call, if not found render standalone
-            if not _tool_manager.handle_tool_output(tool_output):
-                output_text = _parse_output_data(tool_output.output)
-                if len(output_text) > 200:
-                    output_text = output_text[:200] + "..."
-                console.print(
-                    f"[dim]unpaired tool output:[/dim] [dim green]{output_text}[/dim green]"
-                )
-                console.print()
-
-        case ReasoningEvent(text=text):
-            md = Markdown(
-                text, code_theme="ansi_dark", hyperlinks=True, style="dim italic"
-            )
-            console.print(md)
-            console.print()
-
-        case MessageOutputEvent(text=text):
-            md = Markdown(text, code_theme="ansi_dark", hyperlinks=True)
-            console.print(md)
-            console.print()
-
-        case ErrorEvent(message=msg):
-            header = Text("Error", style="bold red")
-            console.print(header)
-            console.print(f"  {msg}")
-            console.print()
+    renderer = _EVENT_RENDERERS.get(type(event))
+    if renderer is not None:
+        renderer(event)
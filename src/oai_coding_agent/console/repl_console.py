@@ -1,20 +1,23 @@
 import asyncio
+import functools
 import logging
 import random
+import time
 from itertools import cycle
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Sequence, Tuple
 
-from prompt_toolkit.application import run_in_terminal
+from prompt_toolkit.application import Application, run_in_terminal
 from prompt_toolkit.filters import completion_is_selected, has_completions
-from prompt_toolkit.formatted_text import FormattedText, to_formatted_text
-from prompt_toolkit.history import FileHistory
+from prompt_toolkit.formatted_text import FormattedText
+from prompt_toolkit.history import ThreadedHistory
 from prompt_toolkit.key_binding import KeyBindings, KeyPressEvent
 from prompt_toolkit.keys import Keys
 from prompt_toolkit.shortcuts import PromptSession
 from rich.panel import Panel
 
-from oai_coding_agent.agent import AsyncAgentProtocol
+from oai_coding_agent.agent import AgentEvent, AsyncAgentProtocol
 from oai_coding_agent.agent.events import UsageEvent
+from oai_coding_agent.console.prompt_history import TailFileHistory
 from oai_coding_agent.console.rendering import console, render_event
 from oai_coding_agent.console.slash_commands import SlashCommandHandler
 from oai_coding_agent.console.token_animator import TokenAnimator
@@ -22,6 +25,80 @@ from oai_coding_agent.xdg import get_data_dir
 
 logger = logging.getLogger(__name__)
 
+# Target render period while the agent is working (10 FPS)
+_FRAME_INTERVAL_NS = 100_000_000
+
+# How long the render loop keeps ticking after a submission without seeing the
+# agent start processing (init failed, or the run began and ended between two
+# frames) before it goes idle again. A run that starts later still wakes the
+# loop through its first event.
+_RUN_START_TIMEOUT_NS = 5_000_000_000
+
+# How long prompt_toolkit waits after "\x1b" before flushing it as a bare ESC
+# key (default 0.5s). Terminals send real escape sequences in one burst, so a
+# short wait is enough.
+_ESC_TIMEOUT = 0.05
+# How long a bare ESC then waits for a following key, because ESC is also the
+# prefix of the ESC, Enter newline binding (default 1s). This has to stay at
+# human typing speed: terminals that don't send Alt as Meta rely on pressing
+# ESC and then Enter as two keystrokes to insert a newline.
+_KEY_SEQUENCE_TIMEOUT = 0.5
+
+_EXIT_COMMANDS = frozenset({"exit", "quit", "/exit", "/quit"})
+_MAX_EXIT_COMMAND_LEN = max(map(len, _EXIT_COMMANDS))
+
+_SPINNER_FRAMES = ("⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏")
+
+# Upper bound on events rendered per terminal suspend in the event consumer
+_MAX_RENDER_BATCH = 64
+
+# Static prompt pieces, built once instead of on every prompt_toolkit redraw
+_IDLE_PROMPT = FormattedText([("ansicyan", "\n\n› ")])
+# Busy prompt template; only the slots below change between redraws
+_BUSY_TEMPLATE = FormattedText(
+    [
+        ("", " "),
+        ("ansicyan", ""),  # spinner frame
+        ("italic", ""),  # status word
+        ("", " " * 28),
+        ("ansiyellow", ""),  # token metrics
+        ("", " "),
+        ("dim", "    ("),
+        ("dim bold", "esc "),
+        ("dim", "to interrupt)\n\n"),
+        ("ansicyan", "› "),
+    ]
+)
+_SPINNER_SLOT, _WORD_SLOT, _METRICS_SLOT = 1, 2, 4
+
+
+def _next_frame_deadline(deadline_ns: int, now_ns: int) -> int:
+    """Return the next frame deadline on a fixed grid of _FRAME_INTERVAL_NS.
+
+    Deadlines are absolute, so time spent redrawing doesn't accumulate as
+    drift. If the loop has fallen behind, missed frames are skipped instead of
+    being rendered in a burst.
+    """
+    return max(deadline_ns + _FRAME_INTERVAL_NS, now_ns)
+
+
+def _render_events_to_str(events: List[AgentEvent]) -> str:
+    """Render a batch of agent events in order and return the captured output.
+
+    Rich's capture buffer is thread-local, so this can run in a worker thread
+    while the event loop keeps handling key presses.
+    """
+    with console.capture() as capture:
+        for event in events:
+            render_event(event)
+    return capture.get()
+
+
+def _write_to_terminal(output: str) -> None:
+    """Write already-rendered console output to the terminal."""
+    console.file.write(output)
+    console.file.flush()
+
 
 class KeyBindingsHandler:
     """Encapsulates custom key bindings for the REPL (Enter, Tab, ESC, Ctrl+J, Alt+Enter)."""
@@ -84,22 +161,19 @@ class KeyBindingsHandler:
             """Handle ESC - cancel current job if agent is processing."""
             if self.agent.is_processing:
                 await self.agent.cancel()
-                await run_in_terminal(
-                    lambda: self._printer("error: Agent cancelled by user", "bold red")
-                )
-
-        # Support Ctrl+J for newline without submission.
-        @kb.add("c-j", eager=True)
-        def _(event: KeyPressEvent) -> None:
-            """Insert newline on Ctrl+J (recommended Shift+Enter mapping in terminal)."""
-            event.current_buffer.insert_text("\n")
+                # The printer already schedules its own run_in_terminal; wrapping
+                # it in another one would suspend and redraw the prompt twice.
+                self._printer("error: Agent cancelled by user", "bold red")
 
-        # Support Alt+Enter for newline without submission.
-        @kb.add(Keys.Escape, Keys.Enter, eager=True)
-        def _(event: KeyPressEvent) -> None:
-            """Insert newline on Alt+Enter."""
+        def insert_newline(event: KeyPressEvent) -> None:
+            """Insert a newline without submitting the prompt."""
             event.current_buffer.insert_text("\n")
 
+        # Ctrl+J (recommended Shift+Enter mapping in terminal) and Alt+Enter
+        # share one handler.
+        kb.add("c-j", eager=True)(insert_newline)
+        kb.add(Keys.Escape, Keys.Enter, eager=True)(insert_newline)
+
         return kb
 
 
@@ -141,39 +215,29 @@ class WordCycler:
 
 
 class Spinner:
-    def __init__(self, interval: float = 0.1) -> None:
-        self._frames = ("⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏")
-        self._cycle = cycle(self._frames)
-        self._current_frame = next(self._cycle)
-        self._interval = interval
-        self._task: Optional[asyncio.Task[None]] = None
+    """Spinner whose styled prompt fragments are built once, at construction."""
 
-    def update(self) -> None:
-        """(Deprecated) Update spinner frame."""
-        self._current_frame = next(self._cycle)
+    def __init__(self, frames: Sequence[str] = _SPINNER_FRAMES) -> None:
+        self._frames = tuple(frames)
+        self._fragments = tuple(("ansicyan", frame) for frame in self._frames)
+        self._index = 0
 
-    def start(self) -> None:
-        """Start the spinner animation."""
-        if not self._task or self._task.done():
-            self._task = asyncio.create_task(self._run())
-
-    def stop(self) -> None:
-        """Stop the spinner animation."""
-        if self._task and not self._task.done():
-            self._task.cancel()
+    def update(self) -> None:
+        """Advance to the next spinner frame (used by ReplConsole's render loop)."""
+        self._index = (self._index + 1) % len(self._frames)
 
-    async def _run(self) -> None:
-        """Advance spinner frames on a timer."""
-        try:
-            while True:
-                self._current_frame = next(self._cycle)
-                await asyncio.sleep(self._interval)
-        except asyncio.CancelledError:
-            pass
+    @property
+    def frame_index(self) -> int:
+        return self._index
 
     @property
     def current_frame(self) -> str:
-        return self._current_frame
+        return self._frames[self._index]
+
+    @property
+    def current_fragment(self) -> Tuple[str, str]:
+        """Prebuilt ``(style, text)`` prompt fragment for the current frame."""
+        return self._fragments[self._index]
 
 
 class ReplConsole:
@@ -182,17 +246,16 @@ class ReplConsole:
     agent: AsyncAgentProtocol
     prompt_session: Optional[PromptSession[str]]
 
-    _render_task: Optional[asyncio.Task[None]]
-    _should_stop_render: bool
+    _processing_event: asyncio.Event
     _usage_state: UsageEvent
+    _banner: Panel
 
     def __init__(self, agent: AsyncAgentProtocol) -> None:
         self.agent = agent
 
         self.prompt_session = None
         self._spinner = Spinner()
-        self._render_task = None
-        self._should_stop_render = False
+        self._processing_event = asyncio.Event()
         self._slash_handler = SlashCommandHandler(
             self._print_to_terminal, self.agent.config
         )
@@ -223,12 +286,20 @@ class ReplConsole:
             animation_duration=1.0,
         )
 
+        # The banner only depends on the config, so build it once up front
+        self._banner = Panel(
+            f"[bold cyan]╭─ OAI CODING AGENT ─╮[/bold cyan]\n\n"
+            f"[dim]Current Directory:[/dim] [dim cyan]{self.agent.config.repo_path}[/dim cyan]\n"
+            f"[dim]Model:[/dim] [dim cyan]{self.agent.config.model.value}[/dim cyan]\n"
+            f"[dim]Mode:[/dim] [dim cyan]{self.agent.config.mode.value}[/dim cyan]",
+            expand=False,
+        )
+
     def prompt_fragments(self) -> FormattedText:
         """Return the complete prompt: status + prompt symbol."""
         if not self.agent.is_processing:
-            return FormattedText([("ansicyan", "\n\n› ")])
+            return _IDLE_PROMPT
 
-        sp = self._spinner.current_frame
         wd = self._word_cycler.current_word
         ci = self._token_animator.current_input
         co = self._token_animator.current_output
@@ -236,81 +307,139 @@ class ReplConsole:
         metrics = (
             f"[{TokenAnimator.format_count(ci)}↑/{TokenAnimator.format_count(co)}↓]"
         )
-        spacer = " " * 28
-
-        fragments = [
-            ("", " "),
-            ("ansicyan", sp),
-            ("italic", f" {wd}"),
-            ("", spacer),
-            ("ansiyellow", metrics),
-            ("", " "),
-            ("dim", "    ("),
-            ("dim bold", "esc "),
-            ("dim", "to interrupt)\n\n"),
-            ("ansicyan", "› "),
-        ]
-        return to_formatted_text(FormattedText(fragments))
 
-    async def _render_loop(self) -> None:
-        """Main render loop - updates live area based on agent state."""
-        try:
-            while not self._should_stop_render:
-                # Spinner auto‑ticks in background; just invalidate UI
-
-                if self.prompt_session and self.prompt_session.app:
-                    self.prompt_session.app.invalidate()
+        fragments = FormattedText(_BUSY_TEMPLATE)
+        fragments[_SPINNER_SLOT] = self._spinner.current_fragment
+        fragments[_WORD_SLOT] = ("italic", f" {wd}")
+        fragments[_METRICS_SLOT] = ("ansiyellow", metrics)
+        return fragments
 
-                await asyncio.sleep(0.1)  # 10 FPS
-        except asyncio.CancelledError:
-            pass
+    async def _render_loop(self) -> None:
+        """Main render loop - animates the live area while a prompt is in flight.
 
-    def _start_render_loop(self) -> None:
-        """Start the render loop."""
-        if not self._render_task or self._render_task.done():
-            self._should_stop_render = False
-            self._render_task = asyncio.create_task(self._render_loop())
+        The loop sleeps on ``_processing_event`` while idle, so an idle REPL
+        does not wake up or redraw. Once a prompt is submitted it ticks at a
+        steady ~10 FPS until the agent has started and then finished processing,
+        or until _RUN_START_TIMEOUT_NS passes without processing being seen.
+        """
+        while True:
+            await self._processing_event.wait()
 
-    def _stop_render_loop(self) -> None:
-        """Stop the render loop."""
-        self._should_stop_render = True
-        if self._render_task and not self._render_task.done():
-            self._render_task.cancel()
+            seen_processing = False
+            deadline_ns = time.monotonic_ns()
+            start_timeout_ns = deadline_ns + _RUN_START_TIMEOUT_NS
+            while True:
+                # If the previous frame hasn't been painted yet (slow
+                # terminal, busy loop), drop this one instead of advancing
+                # the spinner behind the user's back.
+                if not self._redraw_pending():
+                    self._spinner.update()
+                    self._invalidate()
+
+                now_ns = time.monotonic_ns()
+                deadline_ns = _next_frame_deadline(deadline_ns, now_ns)
+                await asyncio.sleep((deadline_ns - now_ns) / 1e9)
+
+                if self.agent.is_processing:
+                    seen_processing = True
+                elif seen_processing or time.monotonic_ns() >= start_timeout_ns:
+                    break
+
+            self._processing_event.clear()
+            # Final redraw so the prompt switches back to its idle form
+            self._invalidate()
+
+    def _running_app(self) -> Optional[Application[str]]:
+        """Return the prompt's Application while it is on screen, else None.
+
+        Between prompts (and before the first / after the last) the app is not
+        running, so there is nothing to redraw.
+        """
+        app = self.prompt_session.app if self.prompt_session else None
+        return app if app is not None and app.is_running else None
+
+    def _redraw_pending(self) -> bool:
+        """True while a previously requested redraw has not been painted yet."""
+        app = self._running_app()
+        return app is not None and app.invalidated
+
+    def _invalidate(self) -> None:
+        """Request a redraw of the prompt, if one is on screen."""
+        app = self._running_app()
+        if app is not None:
+            app.invalidate()
 
     async def _event_stream_consumer(self) -> None:
+        events = self.agent.events
+        loop = asyncio.get_running_loop()
         while True:
-            agent_event = await self.agent.events.get()
-            if isinstance(agent_event, UsageEvent):
-                # Update cumulative usage and animate tokens
-                self._usage_state = self._usage_state + agent_event
-                self._token_animator.update(self._usage_state)
+            # Drain whatever has queued up (bounded) so a burst of events
+            # costs one terminal suspend/redraw instead of one per event.
+            batch = [await events.get()]
+            while len(batch) < _MAX_RENDER_BATCH:
+                try:
+                    batch.append(events.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            # A run that started after the render loop gave up waiting for it
+            # (slow agent init) shows up here first; resume animating it.
+            if self.agent.is_processing:
+                self._processing_event.set()
+
+            to_render: List[AgentEvent] = []
+            for agent_event in batch:
+                if isinstance(agent_event, UsageEvent):
+                    # Update cumulative usage and animate tokens
+                    self._usage_state = self._usage_state + agent_event
+                    self._token_animator.update(self._usage_state)
+                else:
+                    to_render.append(agent_event)
+
+            if not to_render:
                 continue
-            await run_in_terminal(lambda: render_event(agent_event))
+            # Do the Rich formatting (markdown, syntax highlighting) off the
+            # event loop; only the final write needs to hold the terminal.
+            output = await loop.run_in_executor(None, _render_events_to_str, to_render)
+            if output:
+                await run_in_terminal(functools.partial(_write_to_terminal, output))
 
     def _print_to_terminal(self, message: str, style: str = "") -> None:
         """Helper method to print messages to terminal with optional styling."""
         styled_message = f"[{style}]{message}[/{style}]" if style else message
         run_in_terminal(lambda: console.print(styled_message))
 
+    async def _prompt_loop(self) -> None:
+        """Prompt for input until the user exits, dispatching each submission."""
+        assert self.prompt_session is not None
+        while True:
+            logger.info("Prompting user...")
+            user_input = await self.prompt_session.prompt_async()
+            stripped = user_input.strip()
+            if not stripped:
+                continue
+
+            # Length check first so long prompts are never lowercased
+            if (
+                len(stripped) <= _MAX_EXIT_COMMAND_LEN
+                and stripped.lower() in _EXIT_COMMANDS
+            ):
+                return
+
+            if await self._slash_handler.handle(user_input):
+                continue
+
+            # prompt_async has returned, so the prompt is no longer on
+            # screen and the echo can be printed without a terminal
+            # suspend/redraw round-trip.
+            console.print(f"[dim]› {user_input}\n[/dim]")
+
+            await self.agent.run(user_input)
+            self._processing_event.set()
+
     async def run(self) -> None:
         """Interactive REPL loop for the console interface."""
-        event_consumer_task = asyncio.create_task(self._event_stream_consumer())
-
-        # Start spinner and render loop
-        self._spinner.start()
-        self._word_cycler.start()
-        self._token_animator.start()
-        self._start_render_loop()
-
-        console.print(
-            Panel(
-                f"[bold cyan]╭─ OAI CODING AGENT ─╮[/bold cyan]\n\n"
-                f"[dim]Current Directory:[/dim] [dim cyan]{self.agent.config.repo_path}[/dim cyan]\n"
-                f"[dim]Model:[/dim] [dim cyan]{self.agent.config.model.value}[/dim cyan]\n"
-                f"[dim]Mode:[/dim] [dim cyan]{self.agent.config.mode.value}[/dim cyan]",
-                expand=False,
-            )
-        )
+        console.print(self._banner)
 
         kb = self._kb_handler.bindings
 
@@ -321,7 +450,7 @@ class ReplConsole:
 
         self.prompt_session = PromptSession(
             message=self.prompt_fragments,
-            history=FileHistory(str(history_path)),
+            history=ThreadedHistory(TailFileHistory(history_path)),
             completer=self._slash_handler.completer,
             auto_suggest=self._slash_handler.auto_suggest,
             style=self._slash_handler.style,
@@ -332,39 +461,26 @@ class ReplConsole:
         if hasattr(self.prompt_session, "default_buffer"):
             buffer = self.prompt_session.default_buffer
             buffer.on_completions_changed += self._slash_handler.on_completions_changed
-
-        async with self.agent:
+        if hasattr(self.prompt_session, "app"):
+            self.prompt_session.app.ttimeoutlen = _ESC_TIMEOUT
+            self.prompt_session.app.timeoutlen = _KEY_SEQUENCE_TIMEOUT
+
+        # The TaskGroup owns the session's background tasks: they are cancelled
+        # and awaited however the prompt loop ends, and a crash in either one
+        # surfaces instead of leaving the REPL silently stuck.
+        async with self.agent, asyncio.TaskGroup() as tg:
+            event_consumer_task = tg.create_task(self._event_stream_consumer())
+            # The render loop advances the spinner itself
+            render_task = tg.create_task(self._render_loop())
+            self._word_cycler.start()
+            self._token_animator.start()
             try:
-                should_continue = True
-                while should_continue:
-                    logger.info("Prompting user...")
-                    user_input = await self.prompt_session.prompt_async()
-                    if not user_input.strip():
-                        continue
-
-                    if user_input.strip().lower() in ["exit", "quit", "/exit", "/quit"]:
-                        should_continue = False
-                        continue
-
-                    if await self._slash_handler.handle(user_input):
-                        continue
-
-                    self._print_to_terminal(f"› {user_input}\n", "dim")
-
-                    await self.agent.run(user_input)
-
+                await self._prompt_loop()
             except (KeyboardInterrupt, EOFError):
                 # Cancel any running agent task
                 await self.agent.cancel()
-                should_continue = False
-
-            # Cancel the event consumer task when exiting
-            event_consumer_task.cancel()
-            self._stop_render_loop()
-            self._spinner.stop()
-            self._word_cycler.stop()
-            self._token_animator.stop()
-            try:
-                await event_consumer_task
-            except asyncio.CancelledError:
-                pass
+            finally:
+                event_consumer_task.cancel()
+                render_task.cancel()
+                self._word_cycler.stop()
+                self._token_animator.stop()
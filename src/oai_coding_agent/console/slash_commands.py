@@ -1,5 +1,15 @@
+import sys
 from dataclasses import dataclass
-from typing import Awaitable, Callable, Generator, List, Optional, Sequence
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from prompt_toolkit.application import in_terminal
 from prompt_toolkit.auto_suggest import AutoSuggest, Suggestion
@@ -79,19 +89,41 @@ class SlashCommandHandler:
             SlashCommand("/help", "Show help and available commands", self._cmd_help),
         ]
 
-        # Dict for O(1) lookups
+        # Dict for O(1) lookups; keys are interned so a lookup with an identical
+        # (e.g. literal) name short-circuits on identity
         self._commands_by_base = {
-            cmd.name.split()[0].lower(): cmd for cmd in self._commands
+            sys.intern(cmd.name.split()[0].lower()): cmd for cmd in self._commands
         }
 
+        # Per-keystroke completion/suggestion data, built once up front
+        self._completion_entries: List[Tuple[str, str, str]] = []
+        self._suggestions_by_prefix: Dict[str, str] = {}
+        for cmd in self._commands:
+            base = cmd.name.split()[0]
+            base_lower = base.lower()
+            self._completion_entries.append(
+                (base_lower, base, f"{cmd.name:<20} {cmd.description}")
+            )
+            # Map every strict prefix (beyond the bare "/") to the first
+            # command, in definition order, that it could complete to
+            for end in range(2, len(base_lower)):
+                self._suggestions_by_prefix.setdefault(base_lower[:end], base)
+        # Commands are fixed for the session, so /help output is built once
+        self._help_text = (
+            "Available commands:\n\n"
+            + "\n".join(f"{cmd.name:<18} {cmd.description}" for cmd in self._commands)
+            + "\n"
+        )
+        self._max_command_len = max(
+            len(base) for base, _, _ in self._completion_entries
+        )
+
     # ---------------------------------------------------------------------
     # Command Handlers
     # ---------------------------------------------------------------------
     async def _cmd_help(self, _args: Sequence[str]) -> None:
         """Show list of available slash-commands."""
-        lines = [f"{cmd.name:<18} {cmd.description}" for cmd in self._commands]
-        help_text = "Available commands:\n\n" + "\n".join(lines) + "\n"
-        self._printer(help_text, "cyan")
+        self._printer(self._help_text, "cyan")
 
     async def _cmd_github_login(self, _args: Sequence[str]) -> None:
         """Login to GitHub using browser-based flow."""
@@ -120,10 +152,11 @@ class SlashCommandHandler:
                 text = document.text
                 if document.cursor_position_row != 0 or not text.startswith("/"):
                     return
-                for cmd in handler._commands:
-                    base = cmd.name.split()[0]
-                    if base.lower().startswith(text.lower()):
-                        display = f"{cmd.name:<20} {cmd.description}"
+                if len(text) > handler._max_command_len:
+                    return
+                text_lower = text.lower()
+                for base_lower, base, display in handler._completion_entries:
+                    if base_lower.startswith(text_lower):
                         yield Completion(
                             base, start_position=-len(text), display=display
                         )
@@ -142,17 +175,13 @@ class SlashCommandHandler:
                 if (
                     document.cursor_position_row != 0
                     or not text.startswith("/")
-                    or len(text) <= 1
+                    or not 1 < len(text) < handler._max_command_len
                 ):
                     return None
-                for cmd in handler._commands:
-                    base = cmd.name.split()[0]
-                    if (
-                        base.lower().startswith(text.lower())
-                        and base.lower() != text.lower()
-                    ):
-                        return Suggestion(base[len(text) :])
-                return None
+                base = handler._suggestions_by_prefix.get(text.lower())
+                if base is None:
+                    return None
+                return Suggestion(base[len(text) :])
 
         return _SlashAutoSuggest()
 
@@ -167,17 +196,22 @@ class SlashCommandHandler:
         text = user_input.strip()
         if not text.startswith("/"):
             return False
-        # Extract base (first token) and dispatch.
-        parts = text.split()
-        base = parts[0].lower()
-        cmd = self._commands_by_base.get(base)
+        # Only split off the first token: the input may be a large pasted prompt
+        # that merely starts with "/", so avoid tokenizing all of it up front.
+        base, *rest = text.split(None, 1)
+        # Commands are almost always typed in lowercase; only allocate a
+        # lowercased copy when the token as typed isn't a known command
+        cmd = self._commands_by_base.get(base) or self._commands_by_base.get(
+            base.lower()
+        )
         if not cmd:
             return False  # Not a recognised slash-command
 
         # Call the registered handler with remaining args (if any)
+        args = rest[0].split() if rest else []
         try:
             async with in_terminal():
-                await cmd.handler(parts[1:])
+                await cmd.handler(args)
         except Exception as exc:  # noqa: BLE001
             self._printer(f"error: {exc}\n", "red")
         return True
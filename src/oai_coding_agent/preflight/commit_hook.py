@@ -7,6 +7,7 @@ from pathlib import Path
 
 import git
 
+from oai_coding_agent.preflight.git_repo import get_git_config_value
 from oai_coding_agent.xdg import get_data_dir
 
 logger = logging.getLogger(__name__)
@@ -28,23 +29,31 @@ def install_commit_msg_hook(repo_path: Path) -> None:
     hooks_dir = data_home / "hooks"
     hook_file = hooks_dir / "commit-msg"
 
-    if not hooks_dir.exists():
-        hooks_dir.mkdir(parents=True, exist_ok=True)
+    hooks_dir.mkdir(parents=True, exist_ok=True)
 
+    # Open directly instead of checking exists() first: one syscall fewer and
+    # no window between the check and the read
     existing = None
-    if hook_file.exists():
+    try:
         with open(hook_file, "r", encoding="utf-8") as f:
             existing = f.read()
+    except FileNotFoundError:
+        pass
 
     if existing != COMMIT_MSG_HOOK_SCRIPT:
         with open(hook_file, "w", encoding="utf-8") as f:
             f.write(COMMIT_MSG_HOOK_SCRIPT)
         hook_file.chmod(0o755)
-        logger.info(f"Installed commit-msg hook into {hooks_dir}")
+        logger.info("Installed commit-msg hook into %s", hooks_dir)
+
+    # After the first run hooksPath is already set; checking .git/config is far
+    # cheaper than opening the repo with GitPython to rewrite the same value.
+    if get_git_config_value(repo_path, "core", "hooksPath") == str(hooks_dir):
+        return
 
     try:
         repo = git.Repo(str(repo_path), search_parent_directories=True)
         repo.config_writer().set_value("core", "hooksPath", str(hooks_dir)).release()
-        logger.info(f"Configured repo to use commit-msg hook from {hooks_dir}")
+        logger.info("Configured repo to use commit-msg hook from %s", hooks_dir)
     except Exception as e:
-        logger.warning(f"Failed to set git hooks path: {e}")
+        logger.warning("Failed to set git hooks path: %s", e)
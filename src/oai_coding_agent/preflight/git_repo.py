@@ -6,24 +6,130 @@ import logging
 import os
 from pathlib import Path
 from typing import Optional
-from urllib.parse import urlparse
-
-import git
 
 logger = logging.getLogger(__name__)
 
+# Backslash escapes git accepts in config values
+_CONFIG_ESCAPES = {"n": "\n", "t": "\t", "b": "\b", '"': '"', "\\": "\\"}
+
+
+def _find_git_dir(repo_path: Path) -> Optional[Path]:
+    """
+    Return the git directory for the worktree containing repo_path, or None.
+
+    Walks up from repo_path looking for `.git`. Linked worktrees and submodules
+    use a `.git` file holding a `gitdir: <path>` pointer, which is followed.
+    """
+    try:
+        path = repo_path.absolute()
+        if not path.exists():
+            return None
+        for candidate in (path, *path.parents):
+            dot_git = candidate / ".git"
+            if dot_git.is_dir():
+                return dot_git
+            if dot_git.is_file():
+                content = dot_git.read_text(encoding="utf-8").strip()
+                if content.startswith("gitdir:"):
+                    return candidate / content[len("gitdir:") :].strip()
+                # Not a gitdir pointer; git ignores it too and keeps looking
+    except OSError as e:
+        logger.debug("Failed to locate git directory: %s", e)
+    return None
+
+
+def _get_common_dir(git_dir: Path) -> Path:
+    """
+    Return the directory holding the shared config for git_dir.
+    Linked worktrees point at the main repository's git dir via `commondir`.
+    """
+    try:
+        common = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        return git_dir
+    return git_dir / common
+
+
+def _parse_config_value(raw_value: str) -> str:
+    """
+    Decode the text after '=' on a git config line the way git does: drop an
+    unquoted ';' or '#' comment, remove double quotes, apply backslash escapes
+    and trim surrounding whitespace that isn't quoted.
+    """
+    chars: list[str] = []
+    keep = 0  # length up to the last quoted or non-space character
+    in_quotes = False
+    escaped = False
+    for ch in raw_value.lstrip():
+        if escaped:
+            chars.append(_CONFIG_ESCAPES.get(ch, ch))
+            keep = len(chars)
+            escaped = False
+        elif ch == "\\":
+            escaped = True
+        elif ch == '"':
+            in_quotes = not in_quotes
+        elif ch in ";#" and not in_quotes:
+            break
+        else:
+            chars.append(ch)
+            if in_quotes or not ch.isspace():
+                keep = len(chars)
+    return "".join(chars[:keep])
+
+
+def _read_config_value(
+    config_file: Path, section: str, key: str, subsection: Optional[str] = None
+) -> Optional[str]:
+    """
+    Return the value of section[.subsection].key from a git config file, or
+    None if it's not set. Like `git config --get`, the last occurrence wins.
+
+    Only this one file is read. Not supported: [include]/[includeIf] files,
+    url.<base>.insteadOf rewriting, and values continued onto the next line
+    with a trailing backslash.
+    """
+    wanted = (section.lower(), f'"{subsection}"' if subsection else "")
+    current: Optional[tuple[str, str]] = None
+    value: Optional[str] = None
+    for raw_line in config_file.read_text(encoding="utf-8").splitlines():
+        line = raw_line.strip()
+        if line.startswith("["):
+            header, _, _ = line[1:].partition("]")
+            name, _, sub = header.partition(" ")
+            current = (name.lower(), sub.strip())
+            continue
+        if current == wanted:
+            name, sep, raw_value = line.partition("=")
+            if sep and name.strip().lower() == key.lower():
+                value = _parse_config_value(raw_value)
+    return value
+
+
+def get_git_config_value(
+    repo_path: Path, section: str, key: str, subsection: Optional[str] = None
+) -> Optional[str]:
+    """
+    Read a value from the repository's own config file (not global/system).
+    Returns None if the path isn't in a repo or the value isn't set.
+    """
+    git_dir = _find_git_dir(repo_path)
+    if git_dir is None:
+        return None
+    try:
+        return _read_config_value(
+            _get_common_dir(git_dir) / "config", section, key, subsection
+        )
+    except OSError as e:
+        logger.debug("Failed to read git config: %s", e)
+        return None
+
 
 def is_inside_git_repo(repo_path: Path) -> bool:
     """
     Return True if the given path is inside a Git worktree.
     """
-    try:
-        git.Repo(repo_path, search_parent_directories=True)
-        return True
-    except git.InvalidGitRepositoryError:
-        return False
-    except git.NoSuchPathError:
-        return False
+    return _find_git_dir(repo_path) is not None
 
 
 def get_github_repo(repo_path: Path) -> Optional[str]:
@@ -32,12 +138,10 @@ def get_github_repo(repo_path: Path) -> Optional[str]:
     Returns None if extraction fails or if the remote is not on github.com.
     """
     try:
-        repo = git.Repo(repo_path, search_parent_directories=True)
-        if "origin" not in repo.remotes:
+        origin_url = get_git_config_value(repo_path, "remote", "url", "origin")
+        if origin_url is None:
             return None
 
-        origin_url = repo.remotes.origin.url
-
         # Remove trailing ".git"
         if origin_url.endswith(".git"):
             origin_url = origin_url[:-4]
@@ -50,13 +154,14 @@ def get_github_repo(repo_path: Path) -> Optional[str]:
             return None
 
         # HTTPS style: https://github.com/owner/repo
-        parsed = urlparse(origin_url)
-        if parsed.scheme and parsed.netloc in ("github.com", "www.github.com"):
-            return parsed.path.lstrip("/")
+        scheme, sep, rest = origin_url.partition("://")
+        host, _, path = rest.partition("/")
+        if scheme and sep and host in ("github.com", "www.github.com"):
+            return path.lstrip("/")
 
         return None
     except Exception as e:
-        logger.debug(f"Failed to extract GitHub repo: {e}")
+        logger.debug("Failed to extract GitHub repo: %s", e)
         return None
 
 
@@ -68,18 +173,17 @@ def get_git_branch(repo_path: Path) -> Optional[str]:
     """
     prefix = "refs/heads/"
     try:
-        repo = git.Repo(repo_path, search_parent_directories=True)
-        if repo.head.is_detached:
-            # In detached HEAD state, try to get branch from GITHUB_REF
-            ref = os.getenv("GITHUB_REF", "")
-            if ref.startswith(prefix):
-                return ref[len(prefix) :]
-            return None
-        return repo.active_branch.name
+        git_dir = _find_git_dir(repo_path)
+        if git_dir is not None:
+            head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+            if head.startswith(f"ref: {prefix}"):
+                return head[len(f"ref: {prefix}") :]
+        # Detached HEAD (e.g. a CI checkout of a commit) or no repo at all
     except Exception as e:
-        logger.debug(f"Failed to get git branch: {e}")
-        # Fallback to GITHUB_REF (useful in CI environments)
-        ref = os.getenv("GITHUB_REF", "")
-        if ref.startswith(prefix):
-            return ref[len(prefix) :]
-        return None
+        logger.debug("Failed to get git branch: %s", e)
+
+    # Fallback to GITHUB_REF (useful in CI environments)
+    ref = os.getenv("GITHUB_REF", "")
+    if ref.startswith(prefix):
+        return ref[len(prefix) :]
+    return None
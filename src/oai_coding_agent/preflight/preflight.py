@@ -2,9 +2,12 @@
 Preflight checks for the OAI Coding Agent CLI.
 """
 
+import json
 import logging
+import os
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -17,9 +20,12 @@ from oai_coding_agent.preflight.git_repo import (
     get_github_repo,
     is_inside_git_repo,
 )
+from oai_coding_agent.xdg import get_cache_dir
 
 logger = logging.getLogger(__name__)
 
+SKIP_PREFLIGHT_ENV = "OAI_SKIP_PREFLIGHT"
+
 
 class PreflightError(Exception):
     """Base exception for preflight check failures."""
@@ -41,11 +47,16 @@ def _get_tool_version(cmd: list[str]) -> str:
     Raises RuntimeError if command fails or is not found.
     """
     try:
+        # With close_fds=False and an absolute cmd[0], CPython starts the child
+        # with posix_spawn rather than fork+exec, which doesn't have to copy
+        # the page tables of an interpreter that has already loaded the agent
+        # SDK. Our own fds are non-inheritable, so nothing leaks into it.
         completed = subprocess.run(
             cmd,
             capture_output=True,
             text=True,
             check=True,
+            close_fds=False,
         )
         return completed.stdout.strip()
     except FileNotFoundError:
@@ -54,6 +65,44 @@ def _get_tool_version(cmd: list[str]) -> str:
         raise RuntimeError(f"Failed to run '{' '.join(cmd)}': {e}")
 
 
+def _get_cached_tool_version(tool_path: str, cmd: list[str]) -> str:
+    """
+    Like _get_tool_version, but reuse the version recorded on a previous run as
+    long as the binary at tool_path (and PATH itself) is unchanged.
+    """
+    try:
+        real_path = os.path.realpath(tool_path)
+        st = os.stat(real_path)
+    except OSError:
+        return _get_tool_version(cmd)
+
+    key = f"{real_path}:{st.st_mtime_ns}:{st.st_size}:{os.environ.get('PATH', '')}"
+    cache_file = get_cache_dir() / "preflight.json"
+    try:
+        cache = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cache = {}
+    if not isinstance(cache, dict):
+        cache = {}
+
+    entry = cache.get(cmd[0])
+    if isinstance(entry, dict) and entry.get("key") == key:
+        version = entry.get("version")
+        if isinstance(version, str):
+            return version
+
+    version = _get_tool_version(cmd)
+    cache[cmd[0]] = {"key": key, "version": version}
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(".tmp")
+        tmp_file.write_text(json.dumps(cache), encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.debug("Failed to write preflight cache: %s", e)
+    return version
+
+
 def _check_node() -> str:
     """
     Check that 'node' binary is on PATH and return its version string.
@@ -61,7 +110,7 @@ def _check_node() -> str:
     node_path = shutil.which("node")
     if not node_path:
         raise RuntimeError("Node.js binary not found on PATH")
-    return _get_tool_version(["node", "--version"])
+    return _get_cached_tool_version(node_path, [node_path, "--version"])
 
 
 def _check_docker() -> str:
@@ -74,68 +123,89 @@ def _check_docker() -> str:
     if not docker_path:
         raise RuntimeError("Docker binary not found on PATH")
 
-    # Use Docker SDK to verify daemon connectivity
+    # Use Docker SDK to verify daemon connectivity. The version request is
+    # answered by the daemon itself, so it doubles as the liveness check and
+    # saves a separate ping round trip.
     try:
         client = docker.from_env()
-        # Ping the daemon to ensure it's running
-        client.ping()
-        # Get version info
-        version_info = client.version()
-        version_string = f"Docker version {version_info['Version']}"
-        client.close()
-        return version_string
+        try:
+            version_info = client.version()
+        finally:
+            client.close()
+        return f"Docker version {version_info['Version']}"
     except DockerException as e:
-        logger.error(f"Failed to connect to Docker daemon: {str(e)}")
+        logger.error("Failed to connect to Docker daemon: %s", e)
         raise RuntimeError("Failed to connect to Docker daemon")
     except Exception as e:
-        logger.error(f"Unexpected error checking Docker: {str(e)}")
+        logger.error("Unexpected error checking Docker: %s", e)
         raise RuntimeError("Unexpected error checking Docker")
 
 
-def run_preflight_checks(repo_path: Path) -> Tuple[Optional[str], Optional[str]]:
+def _check_requirements(repo_path: Path) -> None:
     """
-    Validate preflight requirements:
-      - Git worktree check
-      - Node.js binary + version
-      - Docker binary + version
-
-    Raises:
-        PreflightCheckError: If any preflight checks fail
-
-    Returns:
-        Tuple of (github_repo, branch_name) - both may be None if extraction fails
+    Check the Git worktree, Node.js and Docker, raising PreflightCheckError
+    with every failure found.
     """
     errors: list[str] = []
 
-    if not is_inside_git_repo(repo_path):
+    # The checks are independent and mostly wait on subprocesses or the Docker
+    # daemon, so run them side by side; wall time is then the slowest check.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        git_future = executor.submit(is_inside_git_repo, repo_path)
+        node_future = executor.submit(_check_node)
+        docker_future = executor.submit(_check_docker)
+
+    if not git_future.result():
         errors.append(f"Path '{repo_path}' is not inside a Git worktree.")
 
     node_version = ""
     try:
-        node_version = _check_node()
+        node_version = node_future.result()
     except RuntimeError as e:
         errors.append(str(e))
 
     docker_version = ""
     try:
-        docker_version = _check_docker()
+        docker_version = docker_future.result()
     except RuntimeError as e:
         errors.append(str(e))
 
     if errors:
         raise PreflightCheckError(errors)
 
-    logger.info(f"Detected Node.js version: {node_version}")
-    logger.info(f"Detected Docker version: {docker_version}")
+    logger.info("Detected Node.js version: %s", node_version)
+    logger.info("Detected Docker version: %s", docker_version)
+
+
+def run_preflight_checks(repo_path: Path) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Validate preflight requirements:
+      - Git worktree check
+      - Node.js binary + version
+      - Docker binary + version
+
+    The checks are skipped when OAI_SKIP_PREFLIGHT is set to a true value
+    (1/true/yes), e.g. in CI images already known to provide all three.
+
+    Raises:
+        PreflightCheckError: If any preflight checks fail
+
+    Returns:
+        Tuple of (github_repo, branch_name) - both may be None if extraction fails
+    """
+    if os.environ.get(SKIP_PREFLIGHT_ENV, "").lower() in ("1", "true", "yes"):
+        logger.info("%s is set; skipping requirement checks", SKIP_PREFLIGHT_ENV)
+    else:
+        _check_requirements(repo_path)
 
     # Extract git info
     github_repo = get_github_repo(repo_path)
     branch_name = get_git_branch(repo_path)
 
     if github_repo:
-        logger.info(f"Detected GitHub repository: {github_repo}")
+        logger.info("Detected GitHub repository: %s", github_repo)
     if branch_name:
-        logger.info(f"Detected git branch: {branch_name}")
+        logger.info("Detected git branch: %s", branch_name)
 
     # Auto-install the commit-msg hook into the user's config dir
     install_commit_msg_hook(repo_path)
@@ -37,11 +37,10 @@ def load_envs(env_file: Optional[str] = None) -> None:
     # Load from multiple sources in order of precedence
     sources = []
 
-    # 1. Load from auth file in the XDG data directory first (for GITHUB_TOKEN)
-
-    auth_file = get_auth_file_path()
-    if auth_file.exists():
-        sources.append(str(auth_file))
+    # 1. Load from auth file in the XDG data directory first (for GITHUB_TOKEN).
+    # No exists() check: dotenv_values already stats the path and treats a
+    # missing file as empty, like the .env source below.
+    sources.append(str(get_auth_file_path()))
 
     # 2. Load from .env file in current directory
     if not env_file:
@@ -21,3 +21,11 @@ def get_data_dir() -> Path:
     """
     data_home = Path(os.environ.get("XDG_DATA_HOME", Path.home() / ".local/share"))
     return data_home / "oai_coding_agent"
+
+
+def get_cache_dir() -> Path:
+    """
+    Return the OAI Coding Agent cache directory under XDG_CACHE_HOME or fallback to ~/.cache.
+    """
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return cache_home / "oai_coding_agent"
@@ -154,6 +154,33 @@ async def test_async_agent_runs_and_emits_events(
         assert agent.events.empty()
 
 
+@pytest.mark.asyncio
+async def test_async_agent_event_queue_applies_backpressure(
+    dummy_config: RuntimeConfig,
+    patch_async_agent: None,
+) -> None:
+    """A full events queue pauses the producer until the consumer catches up."""
+
+    from oai_coding_agent.agent.agent import AsyncAgent
+
+    assert AsyncAgent(dummy_config).events.maxsize == 1024
+
+    async with AsyncAgent(dummy_config, max_queued_events=1) as agent:
+        await agent.events.put(ToolCallEvent(name="backlog", arguments="{}"))
+        await agent.run("prompt")
+
+        # Wait until the producer is running; it must block on the full queue
+        while agent._active_run_task is None:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        assert agent.events.qsize() == 1
+
+        backlog = await asyncio.wait_for(agent.events.get(), timeout=1.0)
+        produced = await asyncio.wait_for(agent.events.get(), timeout=1.0)
+        assert isinstance(backlog, ToolCallEvent) and backlog.name == "backlog"
+        assert isinstance(produced, ToolCallEvent) and produced.name == "dummy_tool"
+
+
 @pytest.mark.asyncio
 async def test_async_agent_cancel_flow(
     dummy_config: RuntimeConfig,
@@ -303,6 +330,62 @@ async def test_async_agent_is_processing_flag(
         assert not agent.is_processing
 
 
+@pytest.mark.parametrize("outcome", ["complete", "fail", "cancel"])
+@pytest.mark.asyncio
+async def test_async_agent_is_processing_clears_when_run_ends(
+    dummy_config: RuntimeConfig,
+    patch_async_agent: None,
+    monkeypatch: pytest.MonkeyPatch,
+    outcome: str,
+) -> None:
+    """is_processing is True while a run is in flight and False once it ends,
+    however it ends."""
+    from agents import Runner
+
+    from oai_coding_agent.agent.agent import AsyncAgent
+    from oai_coding_agent.agent.events import ErrorEvent
+
+    release = asyncio.Event()
+
+    class _ControlledRun(_DummyRunResultStreaming):
+        async def stream_events(self) -> AsyncGenerator[Any, None]:
+            for ev in self._stream_events_data:
+                yield ev
+            await release.wait()
+            if outcome == "fail":
+                raise RuntimeError("run blew up")
+
+    real_run_streamed = Runner.run_streamed
+
+    def controlled_run_streamed(*args: Any, **kwargs: Any) -> _ControlledRun:
+        # Reuse the tool call event built by the patch_async_agent stub
+        stub = real_run_streamed(*args, **kwargs)
+        assert isinstance(stub, _DummyRunResultStreaming)
+        return _ControlledRun(stub._stream_events_data)
+
+    monkeypatch.setattr(Runner, "run_streamed", controlled_run_streamed)
+
+    async with AsyncAgent(dummy_config, max_turns=5) as agent:
+        await agent.run("prompt")
+        first = await asyncio.wait_for(agent.events.get(), timeout=1.0)
+        assert isinstance(first, ToolCallEvent)
+        assert agent.is_processing
+
+        if outcome == "cancel":
+            await agent.cancel()
+        else:
+            release.set()
+        if outcome == "fail":
+            ev = await asyncio.wait_for(agent.events.get(), timeout=1.0)
+            assert isinstance(ev, ErrorEvent)
+
+        for _ in range(100):
+            if not agent.is_processing:
+                break
+            await asyncio.sleep(0.01)
+        assert not agent.is_processing
+
+
 @pytest.mark.asyncio
 async def test_async_agent_initialization_failure(
     dummy_config: RuntimeConfig,
@@ -2,10 +2,13 @@
 
 from unittest.mock import Mock
 
+import pytest
 from agents import RunItemStreamEvent
 from agents.items import (  # type: ignore[attr-defined]
+    McpCall,
     MessageOutputItem,
     ReasoningItem,
+    ResponseFileSearchToolCall,
     ResponseFunctionToolCall,
     ToolCallItem,
     ToolCallOutputItem,
@@ -15,6 +18,7 @@ from openai.lib.streaming.responses._events import ResponseCompletedEvent
 from openai.types.responses.response_input_item_param import FunctionCallOutput
 
 from oai_coding_agent.agent.events import (
+    ErrorEvent,
     MessageOutputEvent,
     ReasoningEvent,
     ToolCallEvent,
@@ -44,6 +48,36 @@ def test_map_tool_call_with_response_function_tool_call() -> None:
     assert result.arguments == '{"arg": "value"}'
 
 
+@pytest.mark.parametrize(
+    ("raw_item", "expected"),
+    [
+        (
+            McpCall(
+                id="m1",
+                name="mcp_tool",
+                arguments="{}",
+                server_label="s",
+                type="mcp_call",
+            ),
+            ToolCallEvent(name="mcp_tool", arguments="{}", call_id="m1"),
+        ),
+        (
+            ResponseFileSearchToolCall(
+                id="f1", queries=["a", "b"], status="completed", type="file_search_call"
+            ),
+            ToolCallEvent(name="file_search", arguments="a, b"),
+        ),
+    ],
+)
+def test_map_tool_call_for_other_tool_types(
+    raw_item: object, expected: ToolCallEvent
+) -> None:
+    event = Mock(spec=RunItemStreamEvent)
+    event.item = ToolCallItem(agent=Mock(), raw_item=raw_item)  # type: ignore[arg-type]
+
+    assert map_sdk_event_to_agent_event(event) == expected
+
+
 def test_map_reasoning_event() -> None:
     """Test mapping reasoning event with summary text."""
     reasoning_item = Mock(spec=ReasoningItem)
@@ -185,6 +219,17 @@ def test_map_tool_call_output_event() -> None:
     assert result.output == '{"foo": "bar"}'
 
 
+def test_map_non_function_tool_output_returns_none() -> None:
+    """Only function_call_output items become ToolCallOutputEvents."""
+    tool_output_item = Mock(spec=ToolCallOutputItem)
+    tool_output_item.raw_item = {"type": "computer_call_output", "call_id": "cid"}
+
+    event = Mock(spec=RunItemStreamEvent)
+    event.item = tool_output_item
+
+    assert map_sdk_event_to_agent_event(event) is None
+
+
 def test_map_non_run_item_event_returns_none() -> None:
     """Test that non-RunItemStreamEvent returns None."""
     event = Mock()  # Not a RunItemStreamEvent
@@ -207,6 +252,13 @@ def test_map_unknown_item_type_returns_none() -> None:
     assert result is None
 
 
+def test_map_raw_delta_event_returns_none() -> None:
+    """Raw response events other than response.completed are dropped."""
+    raw_event = RawResponsesStreamEvent(data=Mock())
+
+    assert map_sdk_event_to_agent_event(raw_event) is None
+
+
 def test_map_response_completed_event_to_usage_event() -> None:
     """Test mapping a ResponseCompletedEvent wrapped in RawResponsesStreamEvent to UsageEvent."""
     mock_input_tokens_details = Mock(cached_tokens=1)
@@ -230,3 +282,18 @@ def test_map_response_completed_event_to_usage_event() -> None:
     assert result.output_tokens == 2
     assert result.reasoning_output_tokens == 2
     assert result.total_tokens == 3
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        ToolCallEvent(name="tool", arguments="{}"),
+        ReasoningEvent(text="thinking"),
+        MessageOutputEvent(text="hello"),
+        ErrorEvent(message="boom"),
+        ToolCallOutputEvent(call_id="cid", output="out"),
+        UsageEvent(1, 2, 3, 4, 10),
+    ],
+)
+def test_agent_events_use_slots(event: object) -> None:
+    assert not hasattr(event, "__dict__")
@@ -1,3 +1,4 @@
+import asyncio
 import os
 from contextlib import AsyncExitStack
 from pathlib import Path
@@ -36,6 +37,17 @@ def test_create_streams_uses_stdio_client_and_devnull(
     QuietMCPServerStdio.create_streams should call stdio_client with the instance params
     and an errlog pointing to os.devnull in write mode.
     """
+    # Nothing is opened at import; the handle appears on first use
+    mcp_servers._devnull.cache_clear()
+    opened: list[str] = []
+    real_open = open
+
+    def tracking_open(file: str, mode: str = "r") -> Any:
+        opened.append(file)
+        return real_open(file, mode)
+
+    monkeypatch.setattr(mcp_servers, "open", tracking_open, raising=False)
+
     calls: list[tuple[Any, Any]] = []
 
     def fake_stdio_client(params: MCPServerStdioParams, errlog: Any) -> str:
@@ -63,6 +75,11 @@ def test_create_streams_uses_stdio_client_and_devnull(
     assert errlog.name == os.devnull
     assert errlog.mode == "w"
 
+    # Every stream shares the same handle
+    ctx.create_streams()
+    assert calls[1][1] is errlog
+    assert opened == [os.devnull]
+
 
 @pytest.mark.asyncio
 async def test_start_mcp_servers_all_success(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -424,3 +441,122 @@ async def test_start_mcp_servers_plan_mode_skip_atlassian_on_error(
         "github-mcp-server",
     ]
     assert len(exit_stack.callbacks) == 4
+
+
+class _StartLog:
+    """Per-test record of which fake servers were entered and exited."""
+
+    def __init__(self, expected: int) -> None:
+        self.entered: list[str] = []
+        self.exited: list[str] = []
+        self.all_started = asyncio.Event()
+        self.expected = expected
+
+
+GatedCtxFactory = Callable[..., tuple[type[Any], _StartLog]]
+
+
+@pytest.fixture
+def gated_ctx_factory() -> GatedCtxFactory:
+    """Build server context classes bound to a fresh _StartLog.
+
+    Each server only finishes starting once ``expected`` servers have begun,
+    so sequential startup would deadlock. Servers named in ``fail`` raise
+    OSError on start instead.
+    """
+
+    def make(
+        expected: int, fail: frozenset[str] = frozenset()
+    ) -> tuple[type[Any], _StartLog]:
+        log = _StartLog(expected)
+
+        class GatedCtx:
+            def __init__(
+                self,
+                name: str,
+                params: Any,
+                client_session_timeout_seconds: int | None = None,
+                cache_tools_list: bool | None = None,
+            ) -> None:
+                self.name = name
+
+            async def __aenter__(self) -> SimpleNamespace:
+                if self.name in fail:
+                    raise OSError(f"{self.name} missing")
+                log.entered.append(self.name)
+                if len(log.entered) == log.expected:
+                    log.all_started.set()
+                await log.all_started.wait()
+                return SimpleNamespace(name=self.name)
+
+            async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+                log.exited.append(self.name)
+
+        return GatedCtx, log
+
+    return make
+
+
+@pytest.mark.asyncio
+async def test_start_mcp_servers_starts_servers_concurrently(
+    monkeypatch: pytest.MonkeyPatch, gated_ctx_factory: GatedCtxFactory
+) -> None:
+    gated_ctx, log = gated_ctx_factory(4)
+    monkeypatch.setattr(mcp_servers, "QuietMCPServerStdio", gated_ctx)
+
+    config = RuntimeConfig(
+        openai_api_key="test-key",
+        github_token="dummy-token",
+        model=ModelChoice.codex_mini_latest,
+        mode=ModeChoice.default,
+        repo_path=Path("/repo"),
+    )
+    async with AsyncExitStack() as stack:
+        # Sequential startup would never get past the first server
+        servers = await asyncio.wait_for(
+            mcp_servers.start_mcp_servers(config, stack), timeout=1.0
+        )
+        assert [s.name for s in servers] == [
+            "file-system-mcp",
+            "cli-mcp-server",
+            "mcp-server-git",
+            "github-mcp-server",
+        ]
+        assert log.exited == []
+
+    # Closing the exit stack shuts every server down
+    assert sorted(log.exited) == sorted(log.entered)
+
+
+@pytest.mark.asyncio
+async def test_start_mcp_servers_raises_when_filesystem_fails(
+    monkeypatch: pytest.MonkeyPatch, gated_ctx_factory: GatedCtxFactory
+) -> None:
+    # The two servers that do start shouldn't wait on the failed one
+    failing_ctx, log = gated_ctx_factory(2, fail=frozenset({"file-system-mcp"}))
+    monkeypatch.setattr(mcp_servers, "QuietMCPServerStdio", failing_ctx)
+
+    config = RuntimeConfig(
+        openai_api_key="test-key",
+        github_token=None,
+        model=ModelChoice.codex_mini_latest,
+        mode=ModeChoice.default,
+        repo_path=Path("/repo"),
+    )
+    exit_stack = DummyExitStack()
+    with pytest.raises(OSError, match="file-system-mcp missing"):
+        await mcp_servers.start_mcp_servers(
+            config, cast(AsyncExitStack[bool | None], exit_stack)
+        )
+    # The servers that did start are still registered for cleanup
+    assert len(exit_stack.callbacks) == 2
+    for close, args in exit_stack.callbacks:
+        await close(*args)
+    assert (
+        sorted(log.exited)
+        == sorted(log.entered)
+        == [
+            "cli-mcp-server",
+            "mcp-server-git",
+        ]
+    )
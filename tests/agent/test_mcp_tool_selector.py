@@ -1,3 +1,4 @@
+import asyncio
 from types import SimpleNamespace
 from typing import Any, List, cast
 
@@ -238,3 +239,34 @@ async def test_atlassian_server_plan_mode_and_flag(
     )
     tools = await get_filtered_function_tools(servers, config)
     assert {t.name for t in tools} == set()
+
+
+@pytest.mark.asyncio
+async def test_fetches_tools_from_servers_concurrently(
+    patch_get_function_tools: pytest.MonkeyPatch,
+) -> None:
+    names = ["file-system-mcp", "cli-mcp-server", "mcp-server-git"]
+    waiting: List[str] = []
+    all_waiting = asyncio.Event()
+
+    async def fake(server: MCPServer, convert_strict: bool) -> List[DummyTool]:
+        waiting.append(server.name)
+        if len(waiting) == len(names):
+            all_waiting.set()
+        # Only returns once every server has been asked
+        await all_waiting.wait()
+        return [DummyTool(f"{server.name}-tool")]
+
+    patch_get_function_tools.setattr(MCPUtil, "get_function_tools", fake)
+    servers = cast(List[MCPServer], [SimpleNamespace(name=n) for n in names])
+    config = RuntimeConfig(
+        openai_api_key="test-key",
+        github_token="dummy-token",
+        model=ModelChoice.codex_mini_latest,
+        mode=ModeChoice.default,
+    )
+    tools = await asyncio.wait_for(
+        get_filtered_function_tools(servers, config), timeout=1.0
+    )
+    # Results keep the server order
+    assert [t.name for t in tools] == [f"{n}-tool" for n in names]
@@ -86,3 +86,27 @@ def test_write_entries_failure(tmp_path: Path, monkeypatch: pytest.MonkeyPatch)
     assert token_storage.save_token("a", "b") is False
     # delete_token should also return False when write fails
     assert token_storage.delete_token("a") is False
+
+
+def test_read_entries_reuses_parse_until_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    assert token_storage.save_token("foo", "bar") is True
+
+    reads: list[Path] = []
+    real_read_text = Path.read_text
+
+    def counting_read_text(self: Path, *args: object, **kwargs: object) -> str:
+        reads.append(self)
+        return real_read_text(self)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+
+    assert token_storage.get_token("foo") == "bar"
+    assert token_storage.has_token("foo")
+    assert len(reads) == 1
+
+    # Writing through the module invalidates the cached parse
+    assert token_storage.save_token("foo", "baz") is True
+    assert token_storage.get_token("foo") == "baz"
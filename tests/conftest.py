@@ -1,5 +1,6 @@
 import asyncio
-from typing import Any
+from pathlib import Path
+from typing import Any, Optional
 
 from oai_coding_agent.agent import AgentEvent, AgentProtocol, AsyncAgentProtocol
 from oai_coding_agent.runtime_config import RuntimeConfig
@@ -46,3 +47,20 @@ class MockConsole:
 
     async def run(self) -> None:
         self.run_called = True
+
+
+def make_repo(
+    path: Path, origin_url: Optional[str] = None, head: str = "ref: refs/heads/main"
+) -> Path:
+    """Create the minimal .git layout git itself writes on init."""
+    git_dir = path / ".git"
+    git_dir.mkdir(parents=True)
+    (git_dir / "HEAD").write_text(f"{head}\n")
+    config = "[core]\n\trepositoryformatversion = 0\n\tbare = false\n"
+    if origin_url is not None:
+        config += (
+            f'[remote "origin"]\n\turl = {origin_url}\n'
+            "\tfetch = +refs/heads/*:refs/remotes/origin/*\n"
+        )
+    (git_dir / "config").write_text(config)
+    return git_dir
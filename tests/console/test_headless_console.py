@@ -51,11 +51,18 @@ async def test_run_prints_prompt_and_renders_events(
     headless = HeadlessConsole(agent)  # type: ignore[arg-type]
 
     printed: List[str] = []
+    buffered: List[bool] = []
 
     class FakeConsole:
         def print(self, msg: str) -> None:
             printed.append(msg)
 
+        def __enter__(self) -> "FakeConsole":
+            buffered.append(True)
+            return self
+
+        def __exit__(self, *exc: Any) -> None: ...
+
     monkeypatch.setattr(console_mod, "console", FakeConsole())
     rendered: List[Any] = []
     monkeypatch.setattr(console_mod, "render_event", lambda ev: rendered.append(ev))
@@ -64,6 +71,8 @@ async def test_run_prints_prompt_and_renders_events(
 
     assert printed == ["[bold cyan]Prompt:[/bold cyan] test prompt"]
     assert rendered == events
+    # One buffered write per event
+    assert len(buffered) == len(events)
 
 
 @pytest.mark.asyncio
@@ -85,11 +94,18 @@ async def test_run_cancel_on_keyboard_interrupt(
     headless = HeadlessConsole(agent)  # type: ignore[arg-type]
 
     printed: List[str] = []
+    buffered: List[bool] = []
 
     class FakeConsole:
         def print(self, msg: str) -> None:
             printed.append(msg)
 
+        def __enter__(self) -> "FakeConsole":
+            buffered.append(True)
+            return self
+
+        def __exit__(self, *exc: Any) -> None: ...
+
     monkeypatch.setattr(console_mod, "console", FakeConsole())
     monkeypatch.setattr(console_mod, "render_event", lambda ev: None)
 
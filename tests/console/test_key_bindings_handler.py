@@ -221,3 +221,37 @@ def test_tab_without_completions(handler_printer_agent, monkeypatch):
 
     monkeypatch.setattr(filters, "has_completions", lambda: False)
     assert not binding.filter()
+
+
+@pytest.mark.asyncio
+async def test_escape_then_enter_as_two_keystrokes_inserts_newline():
+    """With the REPL's timeouts, ESC followed by Enter a moment later (how
+    Alt+Enter arrives in terminals without Meta) still inserts a newline."""
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.input import create_pipe_input
+    from prompt_toolkit.output import DummyOutput
+
+    from oai_coding_agent.console import repl_console
+
+    handler = KeyBindingsHandler(DummyAgent(is_processing=False), DummyPrinter())
+    with create_pipe_input() as inp:
+        session = PromptSession(
+            input=inp, output=DummyOutput(), key_bindings=handler.bindings
+        )
+        session.app.ttimeoutlen = repl_console._ESC_TIMEOUT
+        session.app.timeoutlen = repl_console._KEY_SEQUENCE_TIMEOUT
+
+        async def type_keys():
+            await asyncio.sleep(0.1)
+            inp.send_text("a\x1b")
+            # Slower than the escape-sequence flush, faster than a person
+            await asyncio.sleep(0.15)
+            inp.send_text("\r")
+            await asyncio.sleep(0.1)
+            inp.send_text("b\r")
+
+        typing = asyncio.create_task(type_keys())
+        result = await asyncio.wait_for(session.prompt_async(), 5)
+        await typing
+
+    assert result == "a\nb"
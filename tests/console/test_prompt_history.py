@@ -0,0 +1,47 @@
+from pathlib import Path
+
+import pytest
+from prompt_toolkit.history import FileHistory
+
+from oai_coding_agent.console.prompt_history import TailFileHistory
+
+ENTRIES = ["first", "multi\nline entry", "", "third", "ünïcode", "last one"]
+
+
+@pytest.fixture
+def history_file(tmp_path: Path) -> Path:
+    path = tmp_path / "prompt_history"
+    writer = FileHistory(str(path))
+    for entry in ENTRIES:
+        writer.store_string(entry)
+    return path
+
+
+def test_loads_same_entries_as_file_history(history_file: Path) -> None:
+    expected = list(FileHistory(str(history_file)).load_history_strings())
+    loaded = list(TailFileHistory(history_file).load_history_strings())
+    assert loaded == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+def test_loads_only_newest_entries(history_file: Path, chunk_size: int) -> None:
+    history = TailFileHistory(history_file, max_entries=3, chunk_size=chunk_size)
+    assert list(history.load_history_strings()) == ["last one", "ünïcode", "third"]
+
+
+def test_reads_only_the_tail_of_large_files(history_file: Path) -> None:
+    size = history_file.stat().st_size
+    history = TailFileHistory(history_file, max_entries=1, chunk_size=16)
+    assert len(history._read_tail()) < size
+    assert list(history.load_history_strings()) == ["last one"]
+
+
+def test_missing_file_yields_nothing(tmp_path: Path) -> None:
+    history = TailFileHistory(tmp_path / "missing")
+    assert list(history.load_history_strings()) == []
+
+
+def test_store_string_appends_in_file_history_format(tmp_path: Path) -> None:
+    path = tmp_path / "prompt_history"
+    TailFileHistory(path).store_string("hello\nworld")
+    assert list(FileHistory(str(path)).load_history_strings()) == ["hello\nworld"]
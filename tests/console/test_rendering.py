@@ -0,0 +1,102 @@
+import pytest
+from rich.console import Console
+
+import oai_coding_agent.console.rendering as rendering
+from oai_coding_agent.agent.events import (
+    AgentEvent,
+    ErrorEvent,
+    MessageOutputEvent,
+    ReasoningEvent,
+    ToolCallEvent,
+    ToolCallOutputEvent,
+    UsageEvent,
+)
+from oai_coding_agent.console.rendering import ToolCallManager
+
+
+def test_tool_call_manager_pairs_call_with_output(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    rendered: list[tuple[ToolCallEvent, ToolCallOutputEvent]] = []
+    monkeypatch.setattr(
+        rendering,
+        "render_tool_call_with_output",
+        lambda call, output: rendered.append((call, output)),
+    )
+    manager = ToolCallManager()
+    call = ToolCallEvent(name="read_file", arguments="{}", call_id="c1")
+    output = ToolCallOutputEvent(call_id="c1", output="ok")
+
+    manager.handle_tool_call(call)
+    assert manager.handle_tool_output(output)
+    assert rendered == [(call, output)]
+    assert not manager.pending_tool_calls
+    assert not manager.handle_tool_output(output)
+
+
+def test_tool_call_manager_evicts_oldest_pending_call() -> None:
+    manager = ToolCallManager(max_pending=2)
+    for call_id in ("a", "b", "c"):
+        manager.handle_tool_call(ToolCallEvent("tool", "{}", call_id))
+
+    assert list(manager.pending_tool_calls) == ["b", "c"]
+
+    # Re-registering a pending call id does not evict anything
+    manager.handle_tool_call(ToolCallEvent("tool", "{}", "c"))
+    assert list(manager.pending_tool_calls) == ["b", "c"]
+
+
+@pytest.fixture
+def recorder(monkeypatch: pytest.MonkeyPatch) -> Console:
+    console = Console(record=True, width=80)
+    monkeypatch.setattr(rendering, "console", console)
+    return console
+
+
+@pytest.mark.parametrize(
+    ("event", "expected"),
+    [
+        (MessageOutputEvent(text="**hello** there"), "hello there"),
+        (ReasoningEvent(text="thinking hard"), "thinking hard"),
+        (ErrorEvent(message="it broke"), "it broke"),
+        (ToolCallOutputEvent(call_id="nope", output="orphan"), "unpaired"),
+    ],
+)
+def test_render_event_dispatches_by_type(
+    recorder: Console, event: AgentEvent, expected: str
+) -> None:
+    rendering.render_event(event)
+    assert expected in recorder.export_text()
+
+
+def test_render_event_ignores_unrendered_types(recorder: Console) -> None:
+    rendering.render_event(UsageEvent(1, 0, 1, 0, 2))
+    assert recorder.export_text() == ""
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["", "one line", "a\nb", "\n" * 8, "\n".join(map(str, range(8))), "x\n" * 20],
+)
+def test_truncate_output_lines_keeps_first_lines(text: str) -> None:
+    lines = text.split("\n")
+    expected = "\n".join(lines[:8]) + "\n..." if len(lines) > 8 else text
+    assert rendering._truncate_output_lines(text) == expected
+
+
+@pytest.mark.parametrize(
+    ("tool_call", "expected"),
+    [
+        (ToolCallEvent("read_file", '{"path": "a.py"}'), "Reading a.py"),
+        (ToolCallEvent("shell", "ls -la"), "Running command: ls -la"),
+        (ToolCallEvent("run_command", '{"command": "pwd"}'), "Running command: pwd"),
+        (ToolCallEvent("custom_tool", '{"x": 1}'), "Calling custom_tool with x=1"),
+    ],
+)
+def test_render_tool_call_with_output_dispatches_by_name(
+    recorder: Console, tool_call: ToolCallEvent, expected: str
+) -> None:
+    rendering.render_tool_call_with_output(
+        tool_call, ToolCallOutputEvent(call_id="cid", output="ok")
+    )
+    assert expected in recorder.export_text()
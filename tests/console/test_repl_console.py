@@ -1,8 +1,11 @@
+import asyncio
 from pathlib import Path
 
 import pytest
 
-from oai_coding_agent.console.repl_console import ReplConsole
+import oai_coding_agent.console.repl_console as repl_console_module
+from oai_coding_agent.agent.events import UsageEvent
+from oai_coding_agent.console.repl_console import ReplConsole, Spinner
 from oai_coding_agent.runtime_config import ModeChoice, ModelChoice, RuntimeConfig
 
 
@@ -30,7 +33,7 @@ def test_prompt_fragments_full_list(monkeypatch: pytest.MonkeyPatch) -> None:
     rc = ReplConsole(agent)  # type: ignore[arg-type]
 
     # Fix spinner and word cycler values for predictability
-    monkeypatch.setattr(rc._spinner, "_current_frame", "X")
+    rc._spinner = Spinner(frames=("X",))
     monkeypatch.setattr(rc._word_cycler, "_current_word", "WORD")
 
     # Set token animator values
@@ -50,3 +53,146 @@ def test_prompt_fragments_full_list(monkeypatch: pytest.MonkeyPatch) -> None:
         ("dim", "to interrupt)\n\n"),
         ("ansicyan", "› "),
     ]
+
+
+class _CountingApp:
+    def __init__(self) -> None:
+        self.invalidations = 0
+        self.invalidated = False
+        self.is_running = True
+
+    def invalidate(self) -> None:
+        self.invalidations += 1
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.app = _CountingApp()
+
+
+@pytest.mark.asyncio
+async def test_render_loop_idles_until_prompt_submitted() -> None:
+    agent = DummyAgent(is_processing=False)
+    rc = ReplConsole(agent)  # type: ignore[arg-type]
+    session = _FakeSession()
+    rc.prompt_session = session  # type: ignore[assignment]
+
+    render_task = asyncio.create_task(rc._render_loop())
+    await asyncio.sleep(0.25)
+    assert session.app.invalidations == 0
+
+    # Submitting a prompt wakes the loop; it keeps ticking until processing ends
+    rc._processing_event.set()
+    agent.is_processing = True
+    await asyncio.sleep(0.25)
+    assert session.app.invalidations >= 2
+
+    agent.is_processing = False
+    await asyncio.sleep(0.25)
+    assert not rc._processing_event.is_set()
+    settled = session.app.invalidations
+    await asyncio.sleep(0.25)
+    assert session.app.invalidations == settled
+
+    render_task.cancel()
+
+
+def test_next_frame_deadline_keeps_fixed_grid() -> None:
+    interval = repl_console_module._FRAME_INTERVAL_NS
+    # On time: next deadline is exactly one interval later, regardless of
+    # how long the frame took
+    assert repl_console_module._next_frame_deadline(0, 30_000_000) == interval
+    assert repl_console_module._next_frame_deadline(interval, interval) == (
+        2 * interval
+    )
+    # Fell behind: render immediately rather than bursting missed frames
+    assert repl_console_module._next_frame_deadline(0, 250_000_000) == 250_000_000
+
+
+@pytest.mark.asyncio
+async def test_render_loop_drops_frames_while_redraw_pending() -> None:
+    agent = DummyAgent(is_processing=True)
+    rc = ReplConsole(agent)  # type: ignore[arg-type]
+    session = _FakeSession()
+    session.app.invalidated = True
+    rc.prompt_session = session  # type: ignore[assignment]
+
+    rc._processing_event.set()
+    render_task = asyncio.create_task(rc._render_loop())
+    await asyncio.sleep(0.25)
+    assert session.app.invalidations == 0
+    assert rc._spinner.frame_index == 0
+
+    # Once the pending redraw is painted, frames resume
+    session.app.invalidated = False
+    await asyncio.sleep(0.15)
+    assert session.app.invalidations >= 1
+    assert rc._spinner.frame_index >= 1
+
+    render_task.cancel()
+
+
+def test_invalidate_skips_app_that_is_not_running() -> None:
+    rc = ReplConsole(DummyAgent(is_processing=True))  # type: ignore[arg-type]
+    rc._invalidate()  # no prompt session yet
+
+    session = _FakeSession()
+    session.app.is_running = False
+    session.app.invalidated = True
+    rc.prompt_session = session  # type: ignore[assignment]
+    rc._invalidate()
+    assert session.app.invalidations == 0
+    assert not rc._redraw_pending()
+
+    session.app.is_running = True
+    session.app.invalidated = False
+    rc._invalidate()
+    assert session.app.invalidations == 1
+
+
+def test_banner_is_built_from_config() -> None:
+    rc = ReplConsole(DummyAgent(is_processing=False))  # type: ignore[arg-type]
+    text = str(rc._banner.renderable)
+    assert "/tmp" in text
+    assert ModelChoice.codex_mini_latest.value in text
+    assert ModeChoice.default.value in text
+
+
+@pytest.mark.asyncio
+async def test_render_loop_goes_idle_when_run_never_starts(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # e.g. agent init failed, so the submitted prompt is never processed
+    monkeypatch.setattr(repl_console_module, "_RUN_START_TIMEOUT_NS", 200_000_000)
+    agent = DummyAgent(is_processing=False)
+    rc = ReplConsole(agent)  # type: ignore[arg-type]
+    session = _FakeSession()
+    rc.prompt_session = session  # type: ignore[assignment]
+
+    render_task = asyncio.create_task(rc._render_loop())
+    rc._processing_event.set()
+    await asyncio.sleep(0.4)
+
+    assert not rc._processing_event.is_set()
+    settled = session.app.invalidations
+    await asyncio.sleep(0.25)
+    assert session.app.invalidations == settled
+
+    render_task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_event_from_late_run_wakes_render_loop() -> None:
+    agent = DummyAgent(is_processing=True)
+    agent.events = asyncio.Queue()  # type: ignore[attr-defined]
+    rc = ReplConsole(agent)  # type: ignore[arg-type]
+
+    consumer_task = asyncio.create_task(rc._event_stream_consumer())
+    await agent.events.put(UsageEvent(1, 0, 1, 0, 2))  # type: ignore[attr-defined]
+    for _ in range(100):
+        if rc._processing_event.is_set():
+            break
+        await asyncio.sleep(0.01)
+
+    assert rc._processing_event.is_set()
+    consumer_task.cancel()
@@ -67,3 +67,61 @@ async def test_repl_console_exits_on_exit_and_prints_header(
     # Ensure history directory was created under tmp_path
     history_dir = get_data_dir()
     assert history_dir.is_dir(), "History directory should be created"
+
+
+@pytest.mark.asyncio
+async def test_repl_console_echoes_prompt_and_queues_it(
+    setup_repl: Console, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    recorder = setup_repl
+    inputs = iter(["hello agent", "/exit"])
+
+    class ScriptedPromptSession(DummyPromptSession):
+        async def prompt_async(self) -> str:
+            return next(inputs)
+
+    monkeypatch.setattr(repl_console_module, "PromptSession", ScriptedPromptSession)
+
+    config = RuntimeConfig(
+        openai_api_key="APIKEY",
+        github_token="GHTOKEN",
+        model=ModelChoice.codex_mini_latest,
+        repo_path=tmp_path,
+        mode=ModeChoice.default,
+    )
+    agent = MockAgent(config)
+    await ReplConsole(agent).run()
+
+    assert "› hello agent" in recorder.export_text()
+    assert agent.run_args == ["hello agent"]
+
+
+@pytest.mark.asyncio
+async def test_repl_console_shortens_escape_timeouts(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    class FakeApp:
+        ttimeoutlen = 0.5
+        timeoutlen = 1.0
+
+    class SessionWithApp(DummyPromptSession):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            self.app = FakeApp()
+
+    monkeypatch.setattr(repl_console_module, "PromptSession", SessionWithApp)
+
+    config = RuntimeConfig(
+        openai_api_key="APIKEY",
+        github_token="GHTOKEN",
+        model=ModelChoice.codex_mini_latest,
+        repo_path=tmp_path,
+        mode=ModeChoice.default,
+    )
+    console = ReplConsole(MockAgent(config))
+    await console.run()
+
+    app = console.prompt_session.app  # type: ignore[union-attr]
+    assert app.ttimeoutlen == repl_console_module._ESC_TIMEOUT
+    # ESC then Enter typed as two keys must still reach the newline binding
+    assert app.timeoutlen == repl_console_module._KEY_SEQUENCE_TIMEOUT
+    assert app.timeoutlen >= 0.3
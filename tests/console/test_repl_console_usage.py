@@ -7,7 +7,8 @@ from conftest import MockAgent
 from pytest import MonkeyPatch
 
 import oai_coding_agent.console.repl_console as repl_mod
-from oai_coding_agent.agent.events import ErrorEvent, UsageEvent
+from oai_coding_agent.agent.events import AgentEvent, ErrorEvent, UsageEvent
+from oai_coding_agent.console.rendering import console as rendering_console
 from oai_coding_agent.console.repl_console import ReplConsole
 from oai_coding_agent.runtime_config import ModeChoice, ModelChoice, RuntimeConfig
 
@@ -81,3 +82,58 @@ async def test_repl_console_usage_accumulates(
     assert console._usage_state.output_tokens == 10
     assert console._usage_state.reasoning_output_tokens == 12
     assert console._usage_state.total_tokens == 36
+
+
+@pytest.mark.asyncio
+async def test_repl_console_renders_queued_events_in_one_batch(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    terminal_calls = 0
+    rendered: list[object] = []
+
+    async def counting_run_in_terminal(func: Callable[[], Any]) -> None:
+        nonlocal terminal_calls
+        terminal_calls += 1
+        func()
+
+    def fake_render_event(event: ErrorEvent) -> None:
+        rendered.append(event)
+        rendering_console.print(event.message)
+
+    written: list[str] = []
+    monkeypatch.setattr(repl_mod, "run_in_terminal", counting_run_in_terminal)
+    monkeypatch.setattr(repl_mod, "render_event", fake_render_event)
+    monkeypatch.setattr(repl_mod, "_write_to_terminal", written.append)
+
+    config = RuntimeConfig(
+        openai_api_key="APIKEY",
+        github_token="GHTOKEN",
+        model=ModelChoice.codex_mini_latest,
+        repo_path=tmp_path,
+        mode=ModeChoice.default,
+    )
+    agent = MockAgent(config)
+    console = ReplConsole(agent)
+
+    queued: list[AgentEvent] = [
+        ErrorEvent("one"),
+        UsageEvent(1, 0, 1, 0, 2),
+        ErrorEvent("two"),
+        ErrorEvent("three"),
+    ]
+    for ev in queued:
+        await agent.events.put(ev)
+
+    consumer_task = asyncio.create_task(console._event_stream_consumer())
+    for _ in range(100):
+        if written:
+            break
+        await asyncio.sleep(0.01)
+    consumer_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await consumer_task
+
+    assert terminal_calls == 1
+    assert written[0].split() == ["one", "two", "three"]
+    assert rendered == [queued[0], queued[2], queued[3]]
+    assert console._usage_state.total_tokens == 2
@@ -1,4 +1,3 @@
-from itertools import cycle as _cycle
 from pathlib import Path
 
 import pytest
@@ -29,10 +28,15 @@ def test_prompt_fragments_idle() -> None:
     assert output == "\n\n› "
 
 
+def test_prompt_fragments_idle_is_reused() -> None:
+    rc = ReplConsole(DummyAgent(False))  # type: ignore[arg-type]
+    assert rc.prompt_fragments() is rc.prompt_fragments()
+
+
 def test_prompt_fragments_busy(monkeypatch: pytest.MonkeyPatch) -> None:
     agent = DummyAgent(True)
     rc = ReplConsole(agent)  # type: ignore[arg-type]
-    monkeypatch.setattr(rc._spinner, "_current_frame", "X")
+    rc._spinner = Spinner(frames=("X",))
     text = to_plain_text(rc.prompt_fragments())
     assert "X processing" in text
     assert "(esc to interrupt)" in text
@@ -40,11 +44,7 @@ def test_prompt_fragments_busy(monkeypatch: pytest.MonkeyPatch) -> None:
 
 
 def test_spinner_update_cycles_frames() -> None:
-    spinner = Spinner()
-    # Override frames for predictability
-    spinner._frames = ("A", "B", "C")  # type: ignore[assignment]
-    spinner._cycle = _cycle(spinner._frames)
-    spinner._current_frame = next(spinner._cycle)
+    spinner = Spinner(frames=("A", "B", "C"))
 
     assert spinner.current_frame == "A"
     spinner.update()
@@ -53,3 +53,15 @@ def test_spinner_update_cycles_frames() -> None:
     assert spinner.current_frame == "C"
     spinner.update()
     assert spinner.current_frame == "A"
+
+
+def test_spinner_fragments_are_prebuilt() -> None:
+    spinner = Spinner(frames=("A", "B"))
+    first = spinner.current_fragment
+
+    assert first == ("ansicyan", "A")
+    spinner.update()
+    assert spinner.frame_index == 1
+    assert spinner.current_fragment == ("ansicyan", "B")
+    spinner.update()
+    assert spinner.current_fragment is first
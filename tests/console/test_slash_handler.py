@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Any, Tuple
+from typing import Any, Sequence, Tuple
 from unittest.mock import patch
 
 import pytest
@@ -8,7 +8,7 @@ from prompt_toolkit.buffer import Buffer
 from prompt_toolkit.completion import CompleteEvent
 from prompt_toolkit.document import Document
 
-from oai_coding_agent.console.slash_commands import SlashCommandHandler
+from oai_coding_agent.console.slash_commands import SlashCommand, SlashCommandHandler
 from oai_coding_agent.runtime_config import ModeChoice, ModelChoice, RuntimeConfig
 
 
@@ -63,6 +63,20 @@ async def test_handle_returns_true_and_prints_for_slash(
     assert style == "yellow"
 
 
+async def test_help_lists_all_commands(
+    handler_and_printer: Tuple[SlashCommandHandler, DummyPrinter],
+) -> None:
+    handler, printer = handler_and_printer
+    assert await handler.handle("/help")
+    assert printer.args is not None
+    message, style = printer.args
+    assert style == "cyan"
+    assert message.startswith("Available commands:\n\n")
+    assert message.endswith("\n")
+    for cmd in handler._commands:
+        assert f"{cmd.name:<18} {cmd.description}" in message
+
+
 def test_completions_suggest_slash_commands(
     handler_and_printer: Tuple[SlashCommandHandler, DummyPrinter],
 ) -> None:
@@ -88,6 +102,37 @@ def test_auto_suggest_provides_remainder(
     assert suggestion.text == "ear"
 
 
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("/github-log", "in"),
+        ("/GITHUB-LOGO", "ut"),
+        ("/help", None),
+        ("/nope", None),
+        ("/" + "x" * 10_000, None),
+    ],
+)
+def test_auto_suggest_uses_first_matching_command(
+    handler_and_printer: Tuple[SlashCommandHandler, DummyPrinter],
+    text: str,
+    expected: str | None,
+) -> None:
+    handler, _ = handler_and_printer
+    doc = Document(text=text, cursor_position=len(text))
+    suggestion = handler.auto_suggest.get_suggestion(Buffer(), doc)
+    assert (suggestion.text if suggestion else None) == expected
+
+
+def test_completions_keep_definition_order(
+    handler_and_printer: Tuple[SlashCommandHandler, DummyPrinter],
+) -> None:
+    handler, _ = handler_and_printer
+    doc = Document(text="/GitHub", cursor_position=7)
+    completions = list(handler.completer.get_completions(doc, CompleteEvent()))
+    assert [c.text for c in completions] == ["/github-login", "/github-logout"]
+    assert all(c.start_position == -7 for c in completions)
+
+
 def test_on_completions_changed_sets_index() -> None:
     buf = Buffer()
     fake_state: Any = type("FakeState", (), {"complete_index": None})()
@@ -115,6 +160,22 @@ async def test_handle_with_invalid_command_and_args(
     assert not printer.called
 
 
+async def test_handle_dispatches_case_insensitively_with_tokenized_args(
+    handler_and_printer: Tuple[SlashCommandHandler, DummyPrinter],
+) -> None:
+    handler, _ = handler_and_printer
+    received: list[Sequence[str]] = []
+
+    async def record(args: Sequence[str]) -> None:
+        received.append(args)
+
+    handler._commands_by_base["/clear"] = SlashCommand("/clear", "", record)
+
+    assert await handler.handle("  /CLEAR one\ttwo\n three  ")
+    assert await handler.handle("/clear")
+    assert received == [["one", "two", "three"], []]
+
+
 @pytest.mark.skip(reason="Skipping GitHub workflow installation test")
 async def test_install_workflow_command(
     handler_and_printer: Tuple[SlashCommandHandler, DummyPrinter],
@@ -1,9 +1,11 @@
 import stat
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock
 
 import git
 import pytest
+from conftest import make_repo
 
 from oai_coding_agent.preflight.commit_hook import (
     COMMIT_MSG_HOOK_SCRIPT,
@@ -69,3 +71,47 @@ def test_install_commit_msg_hook_creates_hook_and_configures_git(
 
     # Verify release was called
     mock_config_writer.release.assert_called_once()
+
+
+def test_install_commit_msg_hook_leaves_up_to_date_hook_alone(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    data_home = tmp_path / "data_home"
+    monkeypatch.setenv("XDG_DATA_HOME", str(data_home))
+    monkeypatch.setattr(git, "Repo", lambda *args, **kwargs: MagicMock())
+
+    install_commit_msg_hook(tmp_path)
+    hook_file = data_home / "oai_coding_agent" / "hooks" / "commit-msg"
+    hook_file.chmod(0o700)
+
+    install_commit_msg_hook(tmp_path)
+
+    # Unchanged content is not rewritten (the chmod would have reset the mode)
+    assert stat.S_IMODE(hook_file.stat().st_mode) == 0o700
+    assert hook_file.read_text(encoding="utf-8") == COMMIT_MSG_HOOK_SCRIPT
+
+
+def test_install_commit_msg_hook_skips_git_when_hooks_path_set(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    data_home = tmp_path / "data_home"
+    monkeypatch.setenv("XDG_DATA_HOME", str(data_home))
+    hooks_dir = data_home / "oai_coding_agent" / "hooks"
+
+    repo = tmp_path / "repo"
+    git_dir = make_repo(repo)
+    with open(git_dir / "config", "a") as f:
+        f.write(f"[core]\n\thookspath = {hooks_dir}\n")
+
+    def fail_repo(*args: Any, **kwargs: Any) -> None:
+        pytest.fail("git.Repo should not be opened when hooksPath is already set")
+
+    monkeypatch.setattr(git, "Repo", fail_repo)
+
+    install_commit_msg_hook(repo)
+
+    assert (hooks_dir / "commit-msg").read_text(
+        encoding="utf-8"
+    ) == COMMIT_MSG_HOOK_SCRIPT
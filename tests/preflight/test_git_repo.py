@@ -1,157 +1,188 @@
-"""Test the git module using GitPython."""
+"""Test the git module against on-disk repository layouts."""
 
 from pathlib import Path
-from typing import Any
-from unittest.mock import MagicMock
 
-import git
 import pytest
+from conftest import make_repo
 
 from oai_coding_agent.preflight.git_repo import (
     get_git_branch,
+    get_git_config_value,
     get_github_repo,
     is_inside_git_repo,
 )
 
 
-def test_is_inside_git_repo_valid(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_is_inside_git_repo_valid(tmp_path: Path) -> None:
     """Test when path is inside a valid git repo."""
-    mock_repo = MagicMock()
-    monkeypatch.setattr(git, "Repo", lambda *args, **kwargs: mock_repo)
+    make_repo(tmp_path)
+    subdir = tmp_path / "src" / "pkg"
+    subdir.mkdir(parents=True)
 
-    assert is_inside_git_repo(Path("/some/repo")) is True
+    assert is_inside_git_repo(tmp_path) is True
+    assert is_inside_git_repo(subdir) is True
 
 
-def test_is_inside_git_repo_invalid(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_is_inside_git_repo_invalid(tmp_path: Path) -> None:
     """Test when path is not inside a git repo."""
+    assert is_inside_git_repo(tmp_path) is False
 
-    def raise_invalid(*args: Any, **kwargs: Any) -> None:
-        raise git.InvalidGitRepositoryError()
 
-    monkeypatch.setattr(git, "Repo", raise_invalid)
-
-    assert is_inside_git_repo(Path("/not/a/repo")) is False
-
-
-def test_is_inside_git_repo_no_path(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_is_inside_git_repo_no_path(tmp_path: Path) -> None:
     """Test when path doesn't exist."""
+    make_repo(tmp_path)
 
-    def raise_no_path(*args: Any, **kwargs: Any) -> None:
-        raise git.NoSuchPathError()
+    assert is_inside_git_repo(tmp_path / "nonexistent") is False
 
-    monkeypatch.setattr(git, "Repo", raise_no_path)
 
-    assert is_inside_git_repo(Path("/nonexistent")) is False
+def test_is_inside_git_repo_linked_worktree(tmp_path: Path) -> None:
+    """Test a linked worktree whose .git is a gitdir pointer file."""
+    main_git_dir = make_repo(tmp_path / "main", "git@github.com:owner/repo.git")
+    wt_git_dir = main_git_dir / "worktrees" / "feature"
+    wt_git_dir.mkdir(parents=True)
+    (wt_git_dir / "HEAD").write_text("ref: refs/heads/feature\n")
+    (wt_git_dir / "commondir").write_text("../..\n")
+    worktree = tmp_path / "feature"
+    worktree.mkdir()
+    (worktree / ".git").write_text(f"gitdir: {wt_git_dir}\n")
 
+    assert is_inside_git_repo(worktree) is True
+    assert get_git_branch(worktree) == "feature"
+    assert get_github_repo(worktree) == "owner/repo"
 
-def test_get_github_repo_https(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Test extracting GitHub repo from HTTPS URL."""
-    mock_repo = MagicMock()
-    mock_origin = MagicMock()
-    mock_origin.url = "https://github.com/owner/repo.git"
-    mock_remotes = MagicMock()
-    mock_remotes.__contains__ = lambda self, key: key == "origin"
-    mock_remotes.origin = mock_origin
-    mock_repo.remotes = mock_remotes
 
-    monkeypatch.setattr(git, "Repo", lambda *args, **kwargs: mock_repo)
+def test_get_github_repo_https(tmp_path: Path) -> None:
+    """Test extracting GitHub repo from HTTPS URL."""
+    make_repo(tmp_path, "https://github.com/owner/repo.git")
 
-    assert get_github_repo(Path("/some/repo")) == "owner/repo"
+    assert get_github_repo(tmp_path) == "owner/repo"
 
 
-def test_get_github_repo_ssh(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_get_github_repo_ssh(tmp_path: Path) -> None:
     """Test extracting GitHub repo from SSH URL."""
-    mock_repo = MagicMock()
-    mock_origin = MagicMock()
-    mock_origin.url = "git@github.com:owner/repo.git"
-    mock_remotes = MagicMock()
-    mock_remotes.__contains__ = lambda self, key: key == "origin"
-    mock_remotes.origin = mock_origin
-    mock_repo.remotes = mock_remotes
-
-    monkeypatch.setattr(git, "Repo", lambda *args, **kwargs: mock_repo)
+    make_repo(tmp_path, "git@github.com:owner/repo.git")
 
-    assert get_github_repo(Path("/some/repo")) == "owner/repo"
+    assert get_github_repo(tmp_path) == "owner/repo"
 
 
-def test_get_github_repo_non_github_https(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_get_github_repo_non_github_https(tmp_path: Path) -> None:
     """Test that non-GitHub HTTPS remotes return None."""
-    mock_repo = MagicMock()
-    mock_origin = MagicMock()
-    mock_origin.url = "https://gitlab.com/owner/repo.git"
-    mock_remotes = MagicMock()
-    mock_remotes.__contains__ = lambda self, key: key == "origin"
-    mock_remotes.origin = mock_origin
-    mock_repo.remotes = mock_remotes
+    make_repo(tmp_path, "https://gitlab.com/owner/repo.git")
 
-    monkeypatch.setattr(git, "Repo", lambda *args, **kwargs: mock_repo)
+    assert get_github_repo(tmp_path) is None
 
-    assert get_github_repo(Path("/some/repo")) is None
 
-
-def test_get_github_repo_non_github_ssh(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_get_github_repo_non_github_ssh(tmp_path: Path) -> None:
     """Test that non-GitHub SSH remotes return None."""
-    mock_repo = MagicMock()
-    mock_origin = MagicMock()
-    mock_origin.url = "git@bitbucket.org:owner/repo.git"
-    mock_remotes = MagicMock()
-    mock_remotes.__contains__ = lambda self, key: key == "origin"
-    mock_remotes.origin = mock_origin
-    mock_repo.remotes = mock_remotes
-
-    monkeypatch.setattr(git, "Repo", lambda *args, **kwargs: mock_repo)
+    make_repo(tmp_path, "git@bitbucket.org:owner/repo.git")
 
-    assert get_github_repo(Path("/some/repo")) is None
+    assert get_github_repo(tmp_path) is None
 
 
-def test_get_github_repo_no_origin(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_get_github_repo_no_origin(tmp_path: Path) -> None:
     """Test when repo has no origin remote."""
-    mock_repo = MagicMock()
-    mock_remotes = MagicMock()
-    mock_remotes.__contains__ = lambda self, key: False
-    mock_repo.remotes = mock_remotes
+    git_dir = make_repo(tmp_path)
+    with open(git_dir / "config", "a") as f:
+        f.write('[remote "upstream"]\n\turl = https://github.com/other/repo.git\n')
 
-    monkeypatch.setattr(git, "Repo", lambda *args, **kwargs: mock_repo)
+    assert get_github_repo(tmp_path) is None
 
-    assert get_github_repo(Path("/some/repo")) is None
 
+def test_get_github_repo_not_a_repo(tmp_path: Path) -> None:
+    """Test when path is not inside a git repo."""
+    assert get_github_repo(tmp_path) is None
 
-def test_get_git_branch_normal(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Test getting current branch name."""
-    mock_repo = MagicMock()
-    mock_branch = MagicMock()
-    mock_branch.name = "main"
-    mock_repo.active_branch = mock_branch
-    mock_repo.head.is_detached = False
 
-    monkeypatch.setattr(git, "Repo", lambda *args, **kwargs: mock_repo)
+def test_get_git_branch_normal(tmp_path: Path) -> None:
+    """Test getting current branch name."""
+    make_repo(tmp_path)
 
-    assert get_git_branch(Path("/some/repo")) == "main"
+    assert get_git_branch(tmp_path) == "main"
 
 
 def test_get_git_branch_detached_with_github_ref(
-    monkeypatch: pytest.MonkeyPatch,
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     """Test getting branch from GITHUB_REF when in detached HEAD state."""
-    mock_repo = MagicMock()
-    mock_repo.head.is_detached = True
-
-    monkeypatch.setattr(git, "Repo", lambda *args, **kwargs: mock_repo)
+    make_repo(tmp_path, head="0123456789abcdef0123456789abcdef01234567")
     monkeypatch.setenv("GITHUB_REF", "refs/heads/feature/branch")
 
-    # The function now returns the full branch path after refs/heads/, e.g. 'feature/branch'
-    assert get_git_branch(Path("/some/repo")) == "feature/branch"
+    # The function returns the full branch path after refs/heads/, e.g. 'feature/branch'
+    assert get_git_branch(tmp_path) == "feature/branch"
 
 
-def test_get_git_branch_error_with_github_ref(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Test fallback to GITHUB_REF when GitPython fails."""
+def test_get_git_branch_error_with_github_ref(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test fallback to GITHUB_REF when there is no repo to read."""
+    monkeypatch.setenv("GITHUB_REF", "refs/heads/fallback")
 
-    # When GITHUB_REF has full path, we still return everything after 'refs/heads/'
+    assert get_git_branch(tmp_path) == "fallback"
 
-    def raise_error(*args: Any, **kwargs: Any) -> None:
-        raise Exception("Git error")
 
-    monkeypatch.setattr(git, "Repo", raise_error)
-    monkeypatch.setenv("GITHUB_REF", "refs/heads/fallback")
+def test_get_git_config_value_last_occurrence_wins(tmp_path: Path) -> None:
+    """Test that repeated keys resolve like `git config --get`."""
+    git_dir = make_repo(tmp_path)
+    with open(git_dir / "config", "a") as f:
+        f.write("[core]\n\thooksPath = /first\n[Core]\n\tHOOKSPATH = /second\n")
+
+    assert get_git_config_value(tmp_path, "core", "hooksPath") == "/second"
+    assert get_git_config_value(tmp_path, "core", "missing") is None
+
+
+@pytest.mark.parametrize(
+    "origin_url, expected",
+    [
+        ("https://www.github.com/owner/repo", "owner/repo"),
+        ("http://github.com/owner/repo.git", "owner/repo"),
+        ("https://user@github.com/owner/repo.git", None),
+        ("ssh://git@github.com/owner/repo.git", None),
+        ("github.com/owner/repo", None),
+    ],
+)
+def test_get_github_repo_url_variants(
+    tmp_path: Path, origin_url: str, expected: str | None
+) -> None:
+    """Test host matching for less common remote URL forms."""
+    make_repo(tmp_path, origin_url)
+
+    assert get_github_repo(tmp_path) == expected
+
+
+@pytest.mark.parametrize(
+    "raw_line, expected",
+    [
+        ("url = https://github.com/owner/repo.git # fork", "owner/repo"),
+        ("url = git@github.com:owner/repo.git ; mirror", "owner/repo"),
+        ('url = "https://github.com/owner/repo.git"', "owner/repo"),
+        ('url = "https://github.com/owner/re#po.git" # quoted hash', "owner/re#po"),
+    ],
+)
+def test_get_github_repo_comments_and_quotes(
+    tmp_path: Path, raw_line: str, expected: str
+) -> None:
+    """Test that inline comments and quotes are decoded like git does."""
+    git_dir = make_repo(tmp_path)
+    with open(git_dir / "config", "a") as f:
+        f.write(f'[remote "origin"] # main remote\n\t{raw_line}\n')
+
+    assert get_github_repo(tmp_path) == expected
+
+
+def test_get_git_config_value_escapes(tmp_path: Path) -> None:
+    """Test backslash escapes and quoted whitespace in values."""
+    git_dir = make_repo(tmp_path)
+    with open(git_dir / "config", "a") as f:
+        f.write('[core]\n\thooksPath = " /a\\\\b \\"c\\" "  \n')
+
+    assert get_git_config_value(tmp_path, "core", "hooksPath") == ' /a\\b "c" '
+
+
+def test_is_inside_git_repo_skips_non_gitdir_file(tmp_path: Path) -> None:
+    """Test that a .git file without a gitdir: line doesn't stop the walk."""
+    make_repo(tmp_path)
+    nested = tmp_path / "vendor" / "lib"
+    nested.mkdir(parents=True)
+    (tmp_path / "vendor" / ".git").write_text("not a pointer\n")
 
-    assert get_git_branch(Path("/some/repo")) == "fallback"
+    assert is_inside_git_repo(nested) is True
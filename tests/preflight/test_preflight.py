@@ -1,38 +1,42 @@
 import logging
 import shutil
 import subprocess
+import threading
 from pathlib import Path
 from typing import Any, Sequence
 from unittest.mock import MagicMock, patch
 
 import git
 import pytest
+from conftest import make_repo
 from docker.errors import DockerException
 
+from oai_coding_agent.preflight import preflight
 from oai_coding_agent.preflight.preflight import (
     PreflightCheckError,
     run_preflight_checks,
 )
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    # Keep the on-disk tool version cache out of the real home directory
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
+
+
 def test_run_preflight_success(
-    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture, tmp_path: Path
 ) -> None:
     # Simulate git, node, and docker all present and returning versions
     monkeypatch.setattr(shutil, "which", lambda tool: f"/usr/bin/{tool}")
 
-    # Mock GitPython
+    repo_path = tmp_path / "repo"
+    make_repo(repo_path, "https://github.com/owner/repo.git")
+
+    # Mock GitPython for the hooksPath config write
     mock_repo = MagicMock()
-    mock_origin = MagicMock()
-    mock_origin.url = "https://github.com/owner/repo.git"
-    mock_remotes = MagicMock()
-    mock_remotes.__contains__ = lambda self, key: key == "origin"
-    mock_remotes.origin = mock_origin
-    mock_repo.remotes = mock_remotes
-    mock_branch = MagicMock()
-    mock_branch.name = "main"
-    mock_repo.active_branch = mock_branch
-    mock_repo.head.is_detached = False
     mock_config_writer = MagicMock()
     mock_config_writer.set_value = MagicMock(return_value=mock_config_writer)
     mock_config_writer.release = MagicMock()
@@ -46,8 +50,9 @@ def test_run_preflight_success(
         capture_output: bool | None = None,
         text: bool | None = None,
         check: bool | None = None,
+        close_fds: bool | None = None,
     ) -> subprocess.CompletedProcess[str]:
-        if cmd[:2] == ["node", "--version"]:
+        if cmd[:2] == ["/usr/bin/node", "--version"]:
             return subprocess.CompletedProcess(cmd, 0, stdout="v14.17.0\n")
         pytest.fail(f"Unexpected command: {cmd}")
 
@@ -61,7 +66,7 @@ def test_run_preflight_success(
 
     with patch("docker.from_env", return_value=mock_docker_client):
         caplog.set_level(logging.INFO)
-        github_repo, branch_name = run_preflight_checks(Path("/some/repo"))
+        github_repo, branch_name = run_preflight_checks(repo_path)
 
     assert github_repo == "owner/repo"
     assert branch_name == "main"
@@ -81,20 +86,15 @@ def test_run_preflight_git_failure(monkeypatch: pytest.MonkeyPatch) -> None:
     # Simulate git not inside worktree, node and docker ok
     monkeypatch.setattr(shutil, "which", lambda tool: f"/usr/bin/{tool}")
 
-    # Mock GitPython to raise InvalidGitRepositoryError
-    def raise_invalid(*args: Any, **kwargs: Any) -> None:
-        raise git.InvalidGitRepositoryError()
-
-    monkeypatch.setattr(git, "Repo", raise_invalid)
-
     def fake_run(
         cmd: Sequence[str],
         cwd: Path | None = None,
         capture_output: bool | None = None,
         text: bool | None = None,
         check: bool | None = None,
+        close_fds: bool | None = None,
     ) -> subprocess.CompletedProcess[str]:
-        if cmd[:2] == ["node", "--version"]:
+        if cmd[:2] == ["/usr/bin/node", "--version"]:
             return subprocess.CompletedProcess(cmd, 0, stdout="v14.17.0\n")
         pytest.fail(f"Unexpected command: {cmd}")
 
@@ -114,15 +114,15 @@ def test_run_preflight_git_failure(monkeypatch: pytest.MonkeyPatch) -> None:
     assert len(excinfo.value.errors) == 1
 
 
-def test_run_preflight_node_missing(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_run_preflight_node_missing(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
     # Simulate node missing, git and docker ok
     monkeypatch.setattr(
         shutil, "which", lambda tool: None if tool == "node" else f"/usr/bin/{tool}"
     )
 
-    # Mock GitPython
-    mock_repo = MagicMock()
-    monkeypatch.setattr(git, "Repo", lambda *args, **kwargs: mock_repo)
+    make_repo(tmp_path)
 
     def fake_run(
         cmd: Sequence[str],
@@ -130,6 +130,7 @@ def test_run_preflight_node_missing(monkeypatch: pytest.MonkeyPatch) -> None:
         capture_output: bool | None = None,
         text: bool | None = None,
         check: bool | None = None,
+        close_fds: bool | None = None,
     ) -> subprocess.CompletedProcess[str]:
         pytest.fail(f"Unexpected command: {cmd}")
 
@@ -143,21 +144,21 @@ def test_run_preflight_node_missing(monkeypatch: pytest.MonkeyPatch) -> None:
 
     with patch("docker.from_env", return_value=mock_docker_client):
         with pytest.raises(PreflightCheckError) as excinfo:
-            run_preflight_checks(Path("/repo"))
+            run_preflight_checks(tmp_path)
 
     assert "Node.js binary not found on PATH" in str(excinfo.value)
     assert len(excinfo.value.errors) == 1
 
 
-def test_run_preflight_docker_missing(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_run_preflight_docker_missing(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
     # Simulate docker missing, git and node ok
     monkeypatch.setattr(
         shutil, "which", lambda tool: None if tool == "docker" else f"/usr/bin/{tool}"
     )
 
-    # Mock GitPython
-    mock_repo = MagicMock()
-    monkeypatch.setattr(git, "Repo", lambda *args, **kwargs: mock_repo)
+    make_repo(tmp_path)
 
     def fake_run(
         cmd: Sequence[str],
@@ -165,29 +166,28 @@ def test_run_preflight_docker_missing(monkeypatch: pytest.MonkeyPatch) -> None:
         capture_output: bool | None = None,
         text: bool | None = None,
         check: bool | None = None,
+        close_fds: bool | None = None,
     ) -> subprocess.CompletedProcess[str]:
-        if cmd[:2] == ["node", "--version"]:
+        if cmd[:2] == ["/usr/bin/node", "--version"]:
             return subprocess.CompletedProcess(cmd, 0, stdout="v14.17.0\n")
         pytest.fail(f"Unexpected command: {cmd}")
 
     monkeypatch.setattr(subprocess, "run", fake_run)
 
     with pytest.raises(PreflightCheckError) as excinfo:
-        run_preflight_checks(Path())
+        run_preflight_checks(tmp_path)
 
     assert "Docker binary not found on PATH" in str(excinfo.value)
     assert len(excinfo.value.errors) == 1
 
 
 def test_run_preflight_docker_daemon_not_running(
-    monkeypatch: pytest.MonkeyPatch,
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     # Simulate docker daemon not running, git and node ok
     monkeypatch.setattr(shutil, "which", lambda tool: f"/usr/bin/{tool}")
 
-    # Mock GitPython
-    mock_repo = MagicMock()
-    monkeypatch.setattr(git, "Repo", lambda *args, **kwargs: mock_repo)
+    make_repo(tmp_path)
 
     def fake_run(
         cmd: Sequence[str],
@@ -195,8 +195,9 @@ def test_run_preflight_docker_daemon_not_running(
         capture_output: bool | None = None,
         text: bool | None = None,
         check: bool | None = None,
+        close_fds: bool | None = None,
     ) -> subprocess.CompletedProcess[str]:
-        if cmd[:2] == ["node", "--version"]:
+        if cmd[:2] == ["/usr/bin/node", "--version"]:
             return subprocess.CompletedProcess(cmd, 0, stdout="v14.17.0\n")
         pytest.fail(f"Unexpected command: {cmd}")
 
@@ -208,7 +209,7 @@ def test_run_preflight_docker_daemon_not_running(
         side_effect=DockerException("Error while fetching server API version"),
     ):
         with pytest.raises(PreflightCheckError) as excinfo:
-            run_preflight_checks(Path())
+            run_preflight_checks(tmp_path)
 
     assert "Failed to connect to Docker daemon" in str(excinfo.value)
     assert len(excinfo.value.errors) == 1
@@ -220,18 +221,13 @@ def test_run_preflight_multiple_failures(monkeypatch: pytest.MonkeyPatch) -> Non
         shutil, "which", lambda tool: None if tool == "node" else f"/usr/bin/{tool}"
     )
 
-    # Mock GitPython to raise InvalidGitRepositoryError
-    def raise_invalid(*args: Any, **kwargs: Any) -> None:
-        raise git.InvalidGitRepositoryError()
-
-    monkeypatch.setattr(git, "Repo", raise_invalid)
-
     def fake_run(
         cmd: Sequence[str],
         cwd: Path | None = None,
         capture_output: bool | None = None,
         text: bool | None = None,
         check: bool | None = None,
+        close_fds: bool | None = None,
     ) -> subprocess.CompletedProcess[str]:
         pytest.fail(f"Unexpected command: {cmd}")
 
@@ -251,3 +247,99 @@ def test_run_preflight_multiple_failures(monkeypatch: pytest.MonkeyPatch) -> Non
     assert "not inside a Git worktree" in error_messages
     assert "Node.js binary not found" in error_messages
     assert "Failed to connect to Docker daemon" in error_messages
+
+
+def test_run_preflight_runs_checks_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Each check blocks until all three have started; run sequentially this
+    # would time out on the first one.
+    barrier = threading.Barrier(3, timeout=5)
+
+    def wait_then(value: Any) -> Any:
+        def check(*args: Any) -> Any:
+            barrier.wait()
+            return value
+
+        return check
+
+    monkeypatch.setattr(preflight, "is_inside_git_repo", wait_then(True))
+    monkeypatch.setattr(preflight, "_check_node", wait_then("v20.0.0"))
+    monkeypatch.setattr(preflight, "_check_docker", wait_then("Docker version 1"))
+    monkeypatch.setattr(preflight, "get_github_repo", lambda path: "owner/repo")
+    monkeypatch.setattr(preflight, "get_git_branch", lambda path: "main")
+    monkeypatch.setattr(preflight, "install_commit_msg_hook", lambda path: None)
+
+    assert run_preflight_checks(Path("/repo")) == ("owner/repo", "main")
+
+
+def test_check_docker_single_round_trip_and_closes_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(shutil, "which", lambda tool: f"/usr/bin/{tool}")
+
+    mock_docker_client = MagicMock()
+    mock_docker_client.version.side_effect = DockerException("daemon went away")
+
+    with patch("docker.from_env", return_value=mock_docker_client):
+        with pytest.raises(RuntimeError, match="Failed to connect to Docker daemon"):
+            preflight._check_docker()
+
+    mock_docker_client.ping.assert_not_called()
+    mock_docker_client.close.assert_called_once()
+
+
+def test_check_node_caches_version_until_binary_changes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    node_bin = tmp_path / "node"
+    node_bin.write_text("v1")
+    monkeypatch.setattr(shutil, "which", lambda tool: str(node_bin))
+
+    calls: list[Sequence[str]] = []
+
+    def fake_run(cmd: Sequence[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout=f"{node_bin.read_text()}\n")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    assert preflight._check_node() == "v1"
+    assert preflight._check_node() == "v1"
+    assert len(calls) == 1
+
+    # An upgrade replaces the binary, which changes its size/mtime
+    node_bin.write_text("v22")
+    assert preflight._check_node() == "v22"
+    assert len(calls) == 2
+
+
+def test_get_tool_version_allows_posix_spawn(monkeypatch: pytest.MonkeyPatch) -> None:
+    seen: dict[str, Any] = {}
+
+    def fake_run(cmd: Sequence[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        seen.update(kwargs)
+        return subprocess.CompletedProcess(cmd, 0, stdout="v20.0.0\n")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    assert preflight._get_tool_version(["/usr/bin/node", "--version"]) == "v20.0.0"
+    assert seen["close_fds"] is False
+
+
+def test_run_preflight_skipped_by_env(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("OAI_SKIP_PREFLIGHT", "1")
+    monkeypatch.setenv("GITHUB_REF", "refs/heads/ci-branch")
+    # Nothing is installed and the path isn't a repo; none of it is checked
+    monkeypatch.setattr(shutil, "which", lambda tool: None)
+    monkeypatch.setattr(preflight, "install_commit_msg_hook", lambda path: None)
+
+    def fail(*args: Any, **kwargs: Any) -> None:
+        pytest.fail("requirement checks should be skipped")
+
+    monkeypatch.setattr(subprocess, "run", fail)
+    monkeypatch.setattr("docker.from_env", fail)
+
+    assert run_preflight_checks(tmp_path) == (None, "ci-branch")